@@ -1,7 +1,7 @@
-from .util import timestamp, round2tick, trunc2tick, filter_kwargs, path_join, getenv
+from .util import timestamp, round2tick, trunc2tick, filter_kwargs, path_join, getenv, numpy, nanos
 from .constants import SHORT_BLOCK_WINDOW, STATEFUL_ORDER_TIME_WINDOW
 
 __all__ = [
-  'timestamp', 'round2tick', 'trunc2tick', 'filter_kwargs', 'path_join', 'getenv',
+  'timestamp', 'round2tick', 'trunc2tick', 'filter_kwargs', 'path_join', 'getenv', 'numpy', 'nanos',
   'SHORT_BLOCK_WINDOW', 'STATEFUL_ORDER_TIME_WINDOW',
 ]
\ No newline at end of file
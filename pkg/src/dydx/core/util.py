@@ -31,6 +31,20 @@ def trunc2tick(x: Decimal, tick_size: Decimal) -> Decimal:
 def path_join(base: str, *parts: str):
   return '/'.join([base.rstrip('/')] + [part.lstrip('/') for part in parts])
 
+def numpy():
+  """The `numpy` module, an optional dependency (`pip install typed-dydx[numpy]`)."""
+  try:
+    import numpy
+    return numpy
+  except ImportError as e:
+    raise ImportError('This feature requires numpy: `pip install typed-dydx[numpy]`') from e
+
+def nanos(time: datetime | str) -> int:
+  """Nanoseconds since the epoch (at microsecond precision) of a datetime or ISO timestamp."""
+  if isinstance(time, str):
+    time = datetime.fromisoformat(time[:-1] + '+00:00' if time.endswith('Z') else time)
+  return round(time.timestamp() * 1e6) * 1000
+
 def getenv(var: str) -> str:
   import os
   try:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass as _dataclass, field as _field
-from .data import IndexerData, INDEXER_HTTP_URL, INDEXER_TESTNET_HTTP_URL
+from .data import IndexerData, Validate, INDEXER_HTTP_URL, INDEXER_TESTNET_HTTP_URL
 from .streams import IndexerStreams, INDEXER_WS_URL, INDEXER_TESTNET_WS_URL
 
 @_dataclass
@@ -8,17 +8,17 @@ class Indexer:
   streams: IndexerStreams = _field(default_factory=IndexerStreams)
 
   @classmethod
-  def new(cls, *, http_url: str = INDEXER_HTTP_URL, ws_url: str = INDEXER_WS_URL, validate: bool = True):
+  def new(cls, *, http_url: str = INDEXER_HTTP_URL, ws_url: str = INDEXER_WS_URL, validate: Validate = True):
     return cls(
       data=IndexerData(url=http_url, default_validate=validate),
-      streams=IndexerStreams.new(url=ws_url, validate=validate),
+      streams=IndexerStreams.new(url=ws_url, validate=bool(validate)),
     )
 
   @classmethod
-  def testnet(cls, *, http_url: str = INDEXER_TESTNET_HTTP_URL, ws_url: str = INDEXER_TESTNET_WS_URL, validate: bool = True):
+  def testnet(cls, *, http_url: str = INDEXER_TESTNET_HTTP_URL, ws_url: str = INDEXER_TESTNET_WS_URL, validate: Validate = True):
     return cls(
       data=IndexerData(url=http_url, default_validate=validate),
-      streams=IndexerStreams.new(url=ws_url, validate=validate),
+      streams=IndexerStreams.new(url=ws_url, validate=bool(validate)),
     )
 
   async def __aenter__(self):
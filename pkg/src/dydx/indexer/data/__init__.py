@@ -1,13 +1,12 @@
 from dataclasses import dataclass
 
-from .core import INDEXER_HTTP_URL, INDEXER_TESTNET_HTTP_URL
+from .core import INDEXER_HTTP_URL, INDEXER_TESTNET_HTTP_URL, Validate
 from .api.get_asset_positions import GetAssetPositions
 from .get_candles_paged import GetCandlesPaged
 from .api.get_compliance_screen import GetComplianceScreen
 from .get_fills_paged import GetFillsPaged
 from .get_funding_payments_paged import GetFundingPaymentsPaged
 from .api.get_funding_payments_for_parent_subaccount import GetFundingPaymentsForParentSubaccount
-from .api.get_height import GetHeight
 from .get_historical_funding_paged import GetHistoricalFundingPaged
 from .api.get_historical_pnl import GetHistoricalPnl
 from .get_market import GetMarket
@@ -26,7 +25,7 @@ from .api.get_sparklines import GetSparklines
 from .api.get_subaccount import GetSubaccount
 from .api.get_subaccounts import GetSubaccounts
 from .api.get_time import GetTime
-from .api.get_trades import GetTrades
+from .get_trades_paged import GetTradesPaged
 from .get_transfers_paged import GetTransfersPaged
 from .api.get_transfers_between import GetTransfersBetween
 from .api.get_vaults_historical_pnl import GetVaultsHistoricalPnl
@@ -34,16 +33,20 @@ from .api.list_orders import ListOrders
 from .api.list_parent_orders import ListParentOrders
 from .api.list_parent_positions import ListParentPositions
 from .get_open_position import GetOpenPosition
+from .store import Store
+from .sync import Sync
+from .columnar import Columnar, CandleColumns, TradeColumns, FundingColumns
 
 @dataclass
 class IndexerData(
+  Sync,
+  Columnar,
   GetAssetPositions,
   GetCandlesPaged,
   GetComplianceScreen,
   GetFillsPaged,
   GetFundingPaymentsPaged,
   GetFundingPaymentsForParentSubaccount,
-  GetHeight,
   GetHistoricalFundingPaged,
   GetHistoricalPnl,
   GetMarket,
@@ -62,7 +65,7 @@ class IndexerData(
   GetSubaccount,
   GetSubaccounts,
   GetTime,
-  GetTrades,
+  GetTradesPaged,
   GetTransfersPaged,
   GetTransfersBetween,
   GetVaultsHistoricalPnl,
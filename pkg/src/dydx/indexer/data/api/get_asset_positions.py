@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class AssetPosition(TypedDict):
   size: Decimal
@@ -25,7 +25,7 @@ class GetAssetPositions(IndexerMixin):
     limit: int | None = None,
     created_before_or_at_height: int | None = None,
     created_before_or_at: datetime | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[AssetPosition]:
     """
     Get asset positions
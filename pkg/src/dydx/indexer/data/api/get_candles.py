@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Candle(TypedDict):
   startedAt: datetime
@@ -37,7 +37,7 @@ class GetCandles(IndexerMixin):
     from_iso: datetime | None = None,
     to_iso: datetime | None = None,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> CandlesResponse:
     """
     Retrieve candle data for a perpetual market.
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class ComplianceV2Response(TypedDict):
   status: Literal['COMPLIANT', 'FIRST_STRIKE_CLOSE_ONLY', 'FIRST_STRIKE', 'CLOSE_ONLY', 'BLOCKED']
@@ -15,7 +15,7 @@ class GetComplianceScreen(IndexerMixin):
   async def get_compliance_screen(
     self,
     address: str,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> ComplianceV2Response:
     """
     Get compliance screen
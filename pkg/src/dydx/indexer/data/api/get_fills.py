@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Fill(TypedDict):
   id: str
@@ -45,7 +45,7 @@ class GetFills(IndexerMixin):
     created_before_or_at: datetime | None = None,
     limit: int | None = None,
     page: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> FillsResponse:
     """
     Retrieve fill records for a subaccount.
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class FundingPayment(TypedDict):
   createdAt: datetime
@@ -34,7 +34,7 @@ class GetFundingPayments(IndexerMixin):
     after_or_at: datetime | None = None,
     limit: int | None = None,
     page: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> FundingPaymentsResponse:
     """
     Retrieve funding payment history for a subaccount.
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class FundingPayment(TypedDict):
   createdAt: datetime
@@ -33,7 +33,7 @@ class GetFundingPaymentsForParentSubaccount(IndexerMixin):
     limit: int | None = None,
     after_or_at: datetime | None = None,
     page: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> FundingPaymentsResponse:
     """
     Get funding payments for parent subaccount
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class HeightResponse(TypedDict):
   height: str
@@ -13,7 +13,7 @@ parse_response = response_parser(HeightResponse)
 class GetHeight(IndexerMixin):
   async def get_height(
     self,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> HeightResponse:
     """
     Get height
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Funding(TypedDict):
   ticker: str
@@ -26,7 +26,7 @@ class GetHistoricalFunding(IndexerMixin):
     effective_before_or_at: datetime | None = None,
     effective_before_or_at_height: int | None = None,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> HistoricalFundingResponse:
     """
     Retrieve historical funding data for a perpetual market.
@@ -2,7 +2,7 @@ from typing_extensions import TypedDict
 from dataclasses import dataclass
 
 from dydx.indexer.types import PerpetualMarket
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class GetMarketsResponse(TypedDict):
   markets: dict[str, PerpetualMarket]
@@ -16,7 +16,7 @@ class GetMarkets(IndexerMixin):
     *,
     market: str | None = None,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> GetMarketsResponse:
     """
     Retrieve perpetual market metadata from the indexer. When `market` is provided, the request filters to a single market.
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Order(TypedDict):
   id: str
@@ -39,7 +39,7 @@ class GetOrder(IndexerMixin):
   async def get_order(
     self,
     order_id: str,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> Order:
     """
     Retrieve a single order by order id.
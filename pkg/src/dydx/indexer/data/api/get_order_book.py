@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class BookEntry(TypedDict):
   price: Decimal
@@ -18,7 +18,7 @@ class GetOrderBook(IndexerMixin):
   async def get_order_book(
     self,
     market: str,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> OrderBook:
     """
     Retrieve the orderbook for a perpetual market.
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class AssetPosition(TypedDict):
   size: Decimal
@@ -19,7 +19,7 @@ class GetParentAssetPositions(IndexerMixin):
     address: str,
     *,
     parent_subaccount: int,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[AssetPosition]:
     """
     Get parent asset positions
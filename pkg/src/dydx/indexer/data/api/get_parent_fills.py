@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from dydx.core import timestamp as ts
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Fill(TypedDict):
   id: str
@@ -45,7 +45,7 @@ class GetParentFills(IndexerMixin):
     created_before_or_at: datetime | None = None,
     market: str | None = None,
     market_type: Literal['PERPETUAL', 'SPOT'] | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> FillsResponse:
     """
     Get parent fills
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class PnlTick(TypedDict):
   blockHeight: str
@@ -27,7 +27,7 @@ class GetParentHistoricalPnl(IndexerMixin):
     created_before_or_at: datetime | None = None,
     created_on_or_after_height: int | None = None,
     created_on_or_after: datetime | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[PnlTick]:
     """
     Get parent historical pnl
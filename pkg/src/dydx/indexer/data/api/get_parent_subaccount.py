@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class AssetPosition(TypedDict):
   size: Decimal
@@ -59,7 +59,7 @@ class GetParentSubaccount(IndexerMixin):
     self,
     address: str,
     parent_subaccount: int,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> ParentSubaccount:
     """
     Get parent subaccount
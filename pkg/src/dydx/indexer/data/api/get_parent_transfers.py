@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Account(TypedDict):
   address: str
@@ -35,7 +35,7 @@ class GetParentTransfers(IndexerMixin):
     limit: int | None = None,
     created_before_or_at_height: int | None = None,
     created_before_or_at: datetime | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> TransfersResponse:
     """
     Get parent transfers
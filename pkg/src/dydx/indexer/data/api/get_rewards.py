@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class HistoricalBlockTradingReward(TypedDict):
   tradingReward: Decimal
@@ -21,7 +21,7 @@ class GetRewards(IndexerMixin):
     limit: int | None = None,
     starting_before_or_at_height: int | None = None,
     starting_before_or_at: datetime | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[HistoricalBlockTradingReward]:
     """
     Get historical block trading rewards
@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class HistoricalTradingRewardAggregation(TypedDict):
   tradingReward: Decimal
@@ -24,7 +24,7 @@ class GetRewardsAggregated(IndexerMixin):
     limit: int | None = None,
     starting_before_or_at: datetime | None = None,
     starting_before_or_at_height: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[HistoricalTradingRewardAggregation]:
     """
     Get aggregated trading rewards
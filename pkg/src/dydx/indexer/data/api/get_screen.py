@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class ComplianceResponse(TypedDict):
   restricted: bool
@@ -14,7 +14,7 @@ class GetScreen(IndexerMixin):
     self,
     address: str,
     *,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> ComplianceResponse:
     """
     Get screen
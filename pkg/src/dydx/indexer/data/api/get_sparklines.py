@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from typing_extensions import Literal
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 Sparkline = dict[str, list[Decimal]]
 
@@ -13,7 +13,7 @@ class GetSparklines(IndexerMixin):
     self,
     *,
     time_period: Literal['OneDay', 'SevenDays'],
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> Sparkline:
     """
     Get sparklines
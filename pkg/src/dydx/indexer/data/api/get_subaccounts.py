@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class AssetPosition(TypedDict):
   size: Decimal
@@ -57,7 +57,7 @@ class GetSubaccounts(IndexerMixin):
     address: str,
     *,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> AddressResponse:
     """
     Retrieve subaccounts for an address.
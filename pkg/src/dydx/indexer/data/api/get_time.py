@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing_extensions import TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class TimeResponse(TypedDict):
   iso: datetime
@@ -13,7 +13,7 @@ parse_response = response_parser(TimeResponse)
 class GetTime(IndexerMixin):
   async def get_time(
     self,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> TimeResponse:
     """
     Get time
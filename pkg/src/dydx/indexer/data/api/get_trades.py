@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Trade(TypedDict):
   id: str
@@ -26,7 +26,7 @@ class GetTrades(IndexerMixin):
     *,
     starting_before_or_at_height: int | None = None,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> TradesResponse:
     """
     Retrieve trades for a perpetual market.
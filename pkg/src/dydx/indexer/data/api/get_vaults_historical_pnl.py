@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class PnlTick(TypedDict):
   blockHeight: str
@@ -24,7 +24,7 @@ class GetVaultsHistoricalPnl(IndexerMixin):
     self,
     *,
     resolution: Literal['hour', 'day'],
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[VaultHistoricalPnl]:
     """
     Get vaults historical pnl
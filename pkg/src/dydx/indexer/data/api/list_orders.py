@@ -3,7 +3,7 @@ from datetime import datetime
 from decimal import Decimal
 from dydx.core import timestamp as ts
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class Order(TypedDict):
   id: str
@@ -54,7 +54,7 @@ class ListOrders(IndexerMixin):
     good_til_block_before_or_at: int | None = None,
     good_til_block_time_before_or_at: datetime | None = None,
     return_latest_orders: bool | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[Order]:
     """
     Retrieve orders for a subaccount with optional filters.
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing_extensions import Literal, NotRequired, TypedDict
-from ..core import IndexerMixin, response_parser
+from ..core import IndexerMixin, Validate, response_parser
 
 class PerpetualPosition(TypedDict):
   market: str
@@ -32,7 +32,7 @@ class ListParentPositions(IndexerMixin):
     *,
     parent_subaccount: int,
     limit: int | None = None,
-    validate: bool | None = None
+    validate: Validate | None = None
   ) -> list[PerpetualPosition]:
     """
     List parent positions
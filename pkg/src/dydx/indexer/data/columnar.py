@@ -0,0 +1,172 @@
+"""Columnar (struct-of-arrays) results, built with NumPy (`pip install typed-dydx[numpy]`).
+
+Timestamps are `int64` nanoseconds since the epoch (UTC), decimals are `float64`, sides are `int8` (`1` for `BUY`, `-1` for `SELL`).
+"""
+from typing_extensions import TYPE_CHECKING, Any, ClassVar, Literal, Sequence, Self
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+from dydx.core import numpy, nanos
+from .get_candles_paged import GetCandlesPaged, Resolution
+from .get_historical_funding_paged import GetHistoricalFundingPaged
+from .get_trades_paged import GetTradesPaged
+
+if TYPE_CHECKING:
+  import numpy as np
+
+Kind = Literal['time', 'float', 'int', 'side']
+
+def column(values: list, kind: Kind) -> 'np.ndarray':
+  np = numpy()
+  match kind:
+    case 'time':
+      if values and isinstance(values[0], datetime):
+        return np.array([nanos(t) for t in values], dtype=np.int64)
+      # numpy parses ISO timestamps, but (deprecated) not with a timezone
+      return np.array([t.removesuffix('Z') for t in values], dtype='datetime64[ns]').view(np.int64)
+    case 'float':
+      return np.array(values, dtype=np.float64)
+    case 'int':
+      return np.array(values, dtype=np.int64)
+    case 'side':
+      return np.array([1 if v == 'BUY' else -1 for v in values], dtype=np.int8)
+
+@dataclass
+class Columns:
+  """Struct of arrays, one per field."""
+  kinds: ClassVar[dict[str, Kind]]
+
+  def __len__(self) -> int:
+    return len(getattr(self, fields(self)[0].name))
+
+  @classmethod
+  def from_rows(cls, rows: Sequence[Any]) -> Self:
+    """Build the columns from rows, either raw JSON (`validate=False`) or parsed."""
+    return cls(**{k: column([r[k] for r in rows], kind) for k, kind in cls.kinds.items()})
+
+  @classmethod
+  def concat(cls, parts: Sequence[Self]) -> Self:
+    np = numpy()
+    if not parts:
+      return cls.from_rows([])
+    return cls(**{k: np.concatenate([getattr(p, k) for p in parts]) for k in cls.kinds})
+
+@dataclass
+class CandleColumns(Columns):
+  kinds: ClassVar[dict[str, Kind]] = {
+    'startedAt': 'time', 'open': 'float', 'high': 'float', 'low': 'float', 'close': 'float',
+    'baseTokenVolume': 'float', 'usdVolume': 'float', 'trades': 'int', 'startingOpenInterest': 'float',
+  }
+  startedAt: 'np.ndarray'
+  open: 'np.ndarray'
+  high: 'np.ndarray'
+  low: 'np.ndarray'
+  close: 'np.ndarray'
+  baseTokenVolume: 'np.ndarray'
+  usdVolume: 'np.ndarray'
+  trades: 'np.ndarray'
+  startingOpenInterest: 'np.ndarray'
+
+@dataclass
+class TradeColumns(Columns):
+  kinds: ClassVar[dict[str, Kind]] = {
+    'createdAt': 'time', 'createdAtHeight': 'int', 'price': 'float', 'size': 'float', 'side': 'side',
+  }
+  createdAt: 'np.ndarray'
+  createdAtHeight: 'np.ndarray'
+  price: 'np.ndarray'
+  size: 'np.ndarray'
+  side: 'np.ndarray'
+
+@dataclass
+class FundingColumns(Columns):
+  kinds: ClassVar[dict[str, Kind]] = {
+    'effectiveAt': 'time', 'effectiveAtHeight': 'int', 'rate': 'float', 'price': 'float',
+  }
+  effectiveAt: 'np.ndarray'
+  effectiveAtHeight: 'np.ndarray'
+  rate: 'np.ndarray'
+  price: 'np.ndarray'
+
+@dataclass
+class Columnar(GetCandlesPaged, GetHistoricalFundingPaged, GetTradesPaged):
+  async def get_candles_columns(
+    self,
+    market: str,
+    resolution: Resolution,
+    *,
+    start: datetime,
+    end: datetime | None = None,
+    limit: int = 1000,
+    concurrency: int = 4,
+  ) -> CandleColumns:
+    """Retrieves candle data (as with `get_candles_backfill`) into columns, in chronological order.
+
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `resolution`: The resolution of the candles.
+    - `start`: Fetches candles starting from the given timestamp.
+    - `end`: Fetches candles up to and including the given timestamp (default: now).
+    - `limit`: The number of candles per request (default: 1000, max: 1000).
+    - `concurrency`: The max. number of requests in flight.
+    """
+    paged = self.get_candles_backfill(
+      market, resolution, start=start, end=end, limit=limit, concurrency=concurrency, validate=False,
+    )
+    return CandleColumns.concat([CandleColumns.from_rows(candles) async for candles in paged])
+
+  async def get_trades_columns(
+    self,
+    market: str,
+    *,
+    starting_before_or_at_height: int | None = None,
+    limit: int | None = None,
+    pages: int = 1,
+  ) -> TradeColumns:
+    """Retrieves trades (as with `get_trades_paged`) into columns, newest first.
+
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `starting_before_or_at_height`: If given, fetches trades up to and including the given block height.
+    - `limit`: The max. number of trades to retrieve per request (default: 1000, max: 1000).
+    - `pages`: The max. number of requests to make.
+    """
+    parts: list[TradeColumns] = []
+    seen = set()
+    async for trades in await self.get_trades_paged(market, starting_before_or_at_height=starting_before_or_at_height, limit=limit, validate=False):
+      # pages overlap on the block at their boundary
+      new = [t for t in trades if t['id'] not in seen]
+      seen.update(t['id'] for t in new)
+      parts.append(TradeColumns.from_rows(new))
+      if len(parts) >= pages:
+        break
+    return TradeColumns.concat(parts)
+
+  async def get_historical_funding_columns(
+    self,
+    market: str,
+    *,
+    effective_before_or_at: datetime | None = None,
+    effective_before_or_at_height: int | None = None,
+    limit: int | None = None,
+  ) -> FundingColumns:
+    """Retrieves the whole historical funding (as with `get_historical_funding_paged`) into columns, newest first.
+
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `effective_before_or_at`: If given, fetches funding rates up to and including the given timestamp.
+    - `effective_before_or_at_height`: If given, fetches funding rates up to and including the given block height.
+    - `limit`: The max. number of funding rates to retrieve per request (default: 1000, max: 1000).
+    """
+    parts: list[FundingColumns] = []
+    last_height = None
+    paged = self.get_historical_funding_paged(
+      market, effective_before_or_at=effective_before_or_at,
+      effective_before_or_at_height=effective_before_or_at_height,
+      limit=limit, validate=False,
+    )
+    async for funding in paged:
+      # pages overlap on the funding rate at their boundary
+      if last_height is not None:
+        funding = [f for f in funding if int(f['effectiveAtHeight']) < last_height]
+      if funding:
+        last_height = int(funding[-1]['effectiveAtHeight'])
+        parts.append(FundingColumns.from_rows(funding))
+    return FundingColumns.concat(parts)
@@ -1,5 +1,10 @@
-from typing_extensions import TypeVar, Any, Mapping
+from typing_extensions import TypeVar, Any, Mapping, Callable, Generic, Literal, Union, get_args, get_origin, get_type_hints, is_typeddict
 from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+import sys
+import types
+import orjson
 import pydantic
 import httpx
 
@@ -8,14 +13,132 @@ from typed_core.util import path_join
 
 T = TypeVar('T')
 
-def response_parser(type: type[T]):
-  adapter = pydantic.TypeAdapter(type)
-  def parse_response(r: httpx.Response, *, validate: bool = True) -> T:
-    if r.status_code == 200:
-      return adapter.validate_json(r.text) if validate else r.json()
-    else:
+Validate = bool | Literal['fast']
+"""Response validation mode.
+
+- `True`: validate the whole response with `pydantic`.
+- `'fast'`: decode with `orjson`, then only coerce the `Decimal`/`datetime` fields. No validation.
+- `False`: decode with `orjson`, return the raw JSON.
+"""
+
+Coerce = Callable[[Any], Any]
+
+def parse_decimal(x) -> Decimal:
+  return Decimal(x) if isinstance(x, str) else Decimal(str(x))
+
+if sys.version_info >= (3, 11):
+  parse_datetime = datetime.fromisoformat
+else:
+  def parse_datetime(x: str) -> datetime:
+    if x.endswith('Z'): # `fromisoformat` only accepts it from python 3.11
+      x = x[:-1] + '+00:00'
+    return datetime.fromisoformat(x)
+
+def runtime_type(t) -> type | tuple[type, ...] | None:
+  """JSON type a value annotated as `t` decodes to (or `None` if it doesn't need coercion)."""
+  origin = get_origin(t) or t
+  if origin is list:
+    return list
+  elif origin is dict or is_typeddict(t):
+    return dict
+  elif t is Decimal:
+    return (str, int, float)
+  elif t is datetime:
+    return str
+
+def unwrap_optional(t):
+  origin = get_origin(t)
+  if origin is Union or origin is types.UnionType:
+    args = [arg for arg in get_args(t) if arg is not type(None)]
+    if len(args) == 1:
+      return args[0]
+  return t
+
+def coercer(t) -> Coerce | None:
+  """Build a function coercing the decoded JSON of type `t` in place, or `None` if there's nothing to coerce."""
+  if t is Decimal:
+    return parse_decimal
+  elif t is datetime:
+    return parse_datetime
+  elif is_typeddict(t):
+    # nulls are skipped here, so optional fields use the inner coercer directly
+    fields = [(k, f) for k, v in get_type_hints(t).items() if (f := coercer(unwrap_optional(v))) is not None]
+    if not fields:
+      return None
+    def coerce_dict(obj: dict):
+      for k, f in fields:
+        if (v := obj.get(k)) is not None:
+          obj[k] = f(v)
+      return obj
+    return coerce_dict
+
+  origin = get_origin(t)
+  args = get_args(t)
+  if origin is list:
+    if (f := coercer(args[0])) is None:
+      return None
+    return lambda xs: [f(x) for x in xs]
+  elif origin is dict:
+    if (f := coercer(args[1])) is None:
+      return None
+    return lambda obj: {k: f(v) for k, v in obj.items()}
+  elif origin is Union or origin is types.UnionType:
+    options = [(arg, rt, f) for arg in args if (rt := runtime_type(arg)) is not None and (f := coercer(arg)) is not None]
+    if not options:
+      return None
+    elif len(options) == 1:
+      [(_, _, f)] = options
+      return lambda x: None if x is None else f(x)
+    # TypedDicts all decode to dicts: tell them apart by their required keys, else validate the value with `pydantic`
+    keyed = [(rt, f, frozenset(arg.__required_keys__) if is_typeddict(arg) else frozenset()) for arg, rt, f in options]
+    fallback = ResponseParser(t)
+    def coerce_union(x):
+      matches = [f for rt, f, keys in keyed if isinstance(x, rt) and (not isinstance(x, dict) or keys <= x.keys())]
+      if len(matches) == 1:
+        return matches[0](x)
+      elif not matches and not any(isinstance(x, rt) for rt, _, _ in keyed):
+        return x # null, or a member that needs no coercion
+      return fallback.adapter.validate_python(x)
+    return coerce_union
+
+@dataclass
+class ResponseParser(Generic[T]):
+  """Parses responses into `type`. The `pydantic` adapter and the fast coercion plan are built lazily, on first use."""
+  type: Any
+  _adapter: pydantic.TypeAdapter[T] | None = field(default=None, init=False, repr=False)
+  _coerce: Coerce | None = field(default=None, init=False, repr=False)
+  _planned: bool = field(default=False, init=False, repr=False)
+
+  @property
+  def adapter(self) -> pydantic.TypeAdapter[T]:
+    if self._adapter is None:
+      self._adapter = pydantic.TypeAdapter(self.type)
+    return self._adapter
+
+  @property
+  def coerce(self) -> Coerce | None:
+    if not self._planned:
+      self._coerce = coercer(self.type)
+      self._planned = True
+    return self._coerce
+
+  def __call__(self, r: httpx.Response, *, validate: Validate = True) -> T:
+    if r.status_code != 200:
       raise ApiError(r.status_code, r.json())
-  return parse_response
+    if validate is True:
+      return self.adapter.validate_json(r.content)
+    obj = orjson.loads(r.content)
+    if validate == 'fast' and (coerce := self.coerce) is not None:
+      obj = coerce(obj)
+    return obj
+
+parsers: dict[Any, ResponseParser] = {}
+"""Registry of response parsers, keyed by response type."""
+
+def response_parser(type: type[T]) -> ResponseParser[T]:
+  if (parser := parsers.get(type)) is None:
+    parser = parsers[type] = ResponseParser(type)
+  return parser
 
 INDEXER_HTTP_URL = 'https://indexer.dydx.trade/'
 INDEXER_TESTNET_HTTP_URL = 'https://indexer.v4testnet.dydx.exchange'
@@ -24,15 +147,15 @@ INDEXER_TESTNET_HTTP_URL = 'https://indexer.v4testnet.dydx.exchange'
 class IndexerMixin:
   url: str = INDEXER_HTTP_URL
   client: HttpClient = field(default_factory=HttpClient)
-  default_validate: bool = True
-  
-  def validate(self, validate: bool | None = None) -> bool:
+  default_validate: Validate = True
+
+  def validate(self, validate: Validate | None = None) -> Validate:
     return self.default_validate if validate is None else validate
 
   async def __aenter__(self):
     await self.client.__aenter__()
     return self
-  
+
   async def __aexit__(self, exc_type, exc_value, traceback):
     await self.client.__aexit__(exc_type, exc_value, traceback)
 
@@ -57,4 +180,4 @@ class IndexerMixin:
       content=content, data=data, files=files, auth=auth, follow_redirects=follow_redirects,
       timeout=timeout, extensions=extensions,
       headers=headers,
-    )
\ No newline at end of file
+    )
@@ -1,12 +1,36 @@
 from typing_extensions import AsyncIterable, Literal, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+from typed_core import PaginatedResponse
 from dydx.core import timestamp as ts
+from .paging import ConcurrentPaginatedResponse
 from .api.get_candles import GetCandles, Candle
+from .core import Validate
 
 Resolution = Literal['1MIN', '5MINS', '15MINS', '30MINS', '1HOUR', '4HOURS', '1DAY']
 
+RESOLUTIONS: dict[Resolution, timedelta] = {
+  '1MIN': timedelta(minutes=1),
+  '5MINS': timedelta(minutes=5),
+  '15MINS': timedelta(minutes=15),
+  '30MINS': timedelta(minutes=30),
+  '1HOUR': timedelta(hours=1),
+  '4HOURS': timedelta(hours=4),
+  '1DAY': timedelta(days=1),
+}
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def utc(time: datetime) -> datetime:
+  """`time` as an aware UTC datetime (naive ones are taken as local time, as by `timestamp.dump`)."""
+  return time.astimezone(timezone.utc)
+
+def align(time: datetime, resolution: Resolution) -> datetime:
+  """Floor `time` to the start of its `resolution` candle (in UTC)."""
+  time = utc(time)
+  return time - (time - EPOCH) % RESOLUTIONS[resolution]
+
 @dataclass
 class GetCandlesPaged(GetCandles):
   async def get_candles_paged(
@@ -39,4 +63,57 @@ class GetCandlesPaged(GetCandles):
       if not candles:
         break
       yield candles
-      last_time = candles[-1]['startedAt']
+      # step past the last candle, so that it isn't fetched again
+      last_time = candles[-1]['startedAt'] - RESOLUTIONS[resolution]
+
+  def get_candles_backfill(
+    self,
+    market: str,
+    resolution: Resolution,
+    *,
+    start: datetime,
+    end: datetime | None = None,
+    limit: int = 1000,
+    concurrency: int = 4,
+    validate: Validate | None = None,
+  ) -> PaginatedResponse[Candle, int]:
+    """Retrieves candle data for a specific perpetual market in chronological order, fetching time shards concurrently.
+
+    `[start, end]` is split into resolution-aligned shards of `limit` candles each, which don't overlap.
+
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `resolution`: The resolution of the candles.
+    - `start`: Fetches candles starting from the given timestamp (naive ones are taken as local time).
+    - `end`: Fetches candles up to and including the given timestamp (default: now).
+    - `limit`: The number of candles per shard (default: 1000, max: 1000).
+    - `concurrency`: The max. number of shards in flight.
+    - `validate`: Whether to validate the response against the expected schema.
+    """
+    if limit < 1:
+      raise ValueError(f'limit must be at least 1, got {limit}')
+    if concurrency < 1:
+      raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+    start = utc(start)
+    end = datetime.now(timezone.utc) if end is None else utc(end)
+    step = RESOLUTIONS[resolution]
+    first = align(start, resolution)
+    num_candles = (align(end, resolution) - first) // step + 1
+    num_shards = max(0, -(-num_candles // limit))
+
+    async def next(shard: int) -> tuple[list[Candle], int | None]:
+      if shard >= num_shards:
+        return [], None
+      shard_start = first + shard * limit * step
+      shard_end = min(shard_start + limit * step, first + num_candles * step)
+      response = await self.get_candles(
+        market,
+        resolution=resolution,
+        from_iso=shard_start,
+        to_iso=shard_end - step,
+        limit=limit,
+        validate=validate,
+      )
+      candles = response['candles'][::-1]
+      return candles, shard + 1 if shard + 1 < num_shards else None
+
+    return ConcurrentPaginatedResponse(0, next, concurrency=concurrency)
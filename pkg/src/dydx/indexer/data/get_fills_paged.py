@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from typed_core import PaginatedResponse
+from .paging import ConcurrentPaginatedResponse
 from .api.get_fills import GetFills, Fill
+from .core import Validate
 
 MarketType = Literal['PERPETUAL', 'SPOT']
 
@@ -18,7 +20,8 @@ class GetFillsPaged(GetFills):
     created_before_or_at_height: int | None = None,
     created_before_or_at: datetime | None = None,
     limit: int | None = None,
-    validate: bool | None = None,
+    validate: Validate | None = None,
+    concurrency: int | None = None,
   ) -> PaginatedResponse[Fill, int]:
     """Retrieves fill records for a specific subaccount on the exchange. A fill represents a trade that has been executed.
 
@@ -30,6 +33,7 @@ class GetFillsPaged(GetFills):
     - `created_before_or_at`: If given, fetches fills up to and including the given timestamp.
     - `limit`: The max. number of fills to retrieve (default: 1000, max: 1000).
     - `validate`: Whether to validate the response against the expected schema.
+    - `concurrency`: If given, keeps up to `concurrency` page requests in flight (pages are still yielded in order). Requires `limit`.
 
     > [dYdX API docs](https://docs.dydx.xyz/indexer-client/http#get-fills)
     """
@@ -49,4 +53,8 @@ class GetFillsPaged(GetFills):
       next_page = page + 1 if len(fills) == limit else None
       return fills, next_page
 
-    return PaginatedResponse(1, next)
+    if concurrency is None:
+      return PaginatedResponse(1, next)
+    elif limit is None:
+      raise ValueError('`limit` is required to fetch pages concurrently')
+    return ConcurrentPaginatedResponse(1, next, concurrency=concurrency)
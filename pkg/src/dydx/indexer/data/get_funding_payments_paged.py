@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from typed_core import PaginatedResponse
+from .paging import ConcurrentPaginatedResponse
 from .api.get_funding_payments import GetFundingPayments, FundingPayment
+from .core import Validate
 
 @dataclass
 class GetFundingPaymentsPaged(GetFundingPayments):
@@ -15,7 +17,8 @@ class GetFundingPaymentsPaged(GetFundingPayments):
     ticker: str | None = None,
     after_or_at: datetime | None = None,
     limit: int | None = None,
-    validate: bool | None = None,
+    validate: Validate | None = None,
+    concurrency: int | None = None,
   ) -> PaginatedResponse[FundingPayment, int]:
     """Retrieves funding payment history for a specific subaccount. Funding payments are periodic settlements that occur between long and short positions based on the funding rate.
 
@@ -25,6 +28,7 @@ class GetFundingPaymentsPaged(GetFundingPayments):
     - `after_or_at`: If given, fetches funding payments starting from the given timestamp.
     - `limit`: The max. number of funding payments to retrieve.
     - `validate`: Whether to validate the response against the expected schema.
+    - `concurrency`: If given, keeps up to `concurrency` page requests in flight (pages are still yielded in order). Requires `limit`.
 
     > [dYdX API docs](https://docs.dydx.xyz/indexer-client/http#get-funding-payments)
     """
@@ -42,4 +46,8 @@ class GetFundingPaymentsPaged(GetFundingPayments):
       next_page = page + 1 if len(funding_payments) == limit else None
       return funding_payments, next_page
 
-    return PaginatedResponse(1, next)
+    if concurrency is None:
+      return PaginatedResponse(1, next)
+    elif limit is None:
+      raise ValueError('`limit` is required to fetch pages concurrently')
+    return ConcurrentPaginatedResponse(1, next, concurrency=concurrency)
@@ -3,6 +3,7 @@ from datetime import datetime
 
 from typed_core import PaginatedResponse
 from .api.get_historical_funding import GetHistoricalFunding, Funding
+from .core import Validate
 
 @dataclass
 class GetHistoricalFundingPaged(GetHistoricalFunding):
@@ -13,6 +14,7 @@ class GetHistoricalFundingPaged(GetHistoricalFunding):
     effective_before_or_at: datetime | None = None,
     effective_before_or_at_height: int | None = None,
     limit: int | None = None,
+    validate: Validate | None = None,
   ) -> PaginatedResponse[Funding, int]:
     """Retrieves historical funding rates for a specific perpetual market, automatically paginating.
 
@@ -20,6 +22,7 @@ class GetHistoricalFundingPaged(GetHistoricalFunding):
     - `effective_before_or_at`: If given, fetches funding rates up to and including the given timestamp.
     - `effective_before_or_at_height`: If given, fetches funding rates up to and including the given block height.
     - `limit`: The max. number of candles to retrieve (default: 1000, max: 1000).
+    - `validate`: Whether to validate the response against the expected schema.
     """
     last_block = effective_before_or_at_height or -1
     async def next(last_block: int | None) -> tuple[list[Funding], int | None]:
@@ -30,6 +33,7 @@ class GetHistoricalFundingPaged(GetHistoricalFunding):
         effective_before_or_at=effective_before_or_at,
         effective_before_or_at_height=last_block,
         limit=limit,
+        validate=validate,
       )
       historical_funding = response['historicalFunding']
       if not historical_funding:
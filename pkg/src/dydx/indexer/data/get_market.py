@@ -1,16 +1,25 @@
-from dataclasses import dataclass
+from typing_extensions import TYPE_CHECKING
+from dataclasses import dataclass, field
 
 from .api.get_markets import GetMarkets, PerpetualMarket
+from .core import Validate
 
+if TYPE_CHECKING:
+  from dydx.indexer.streams.markets import MarketRegistry
 
 @dataclass
 class GetMarket(GetMarkets):
+  market_registry: 'MarketRegistry | None' = field(default=None, kw_only=True, repr=False)
+  """If set (e.g. to the reply of `IndexerStreams.market_registry()`), `get_market` reads the markets it has from it, without a request."""
+
   async def get_market(
     self,
     market: str,
     *,
-    validate: bool | None = None,
+    validate: Validate | None = None,
   ) -> PerpetualMarket:
-    """Retrieves a single perpetual market by ticker."""
+    """Retrieves a single perpetual market by ticker (from `market_registry`, if set and it has it)."""
+    if self.market_registry is not None and (m := self.market_registry.get(market)) is not None:
+      return m
     response = await self.get_markets(market=market, limit=1, validate=validate)
     return response['markets'][market] if 'markets' in response else response[market]
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from .api.list_positions import ListPositions, PerpetualPosition
+from .core import Validate
 
 
 @dataclass
@@ -11,7 +12,7 @@ class GetOpenPosition(ListPositions):
     market: str,
     *,
     subaccount: int,
-    validate: bool | None = None,
+    validate: Validate | None = None,
   ) -> PerpetualPosition | None:
     """Retrieves the open perpetual position for a specific subaccount."""
     response = await self.list_positions(
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from typed_core import PaginatedResponse
+from .api.get_trades import GetTrades, Trade
+from .api.get_height import GetHeight
+from .core import Validate
+
+@dataclass
+class GetTradesPaged(GetTrades, GetHeight):
+  async def get_trades_paged(
+    self,
+    market: str,
+    *,
+    starting_before_or_at_height: int | None = None,
+    limit: int | None = None,
+    validate: Validate | None = None,
+  ) -> PaginatedResponse[Trade, int]:
+    """Retrieves trades for a specific perpetual market, newest first, automatically paginating.
+
+    Pages are split by block height, so trades of the block at a page boundary may be repeated on the next page. Raises `ValueError` if a single block has more trades than fit in a page.
+
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `starting_before_or_at_height`: If given, fetches trades up to and including the given block height (default: the indexer's current height, fetched once, so that retried or resumed pages are the same).
+    - `limit`: The max. number of trades to retrieve per request (default: 1000, max: 1000).
+    - `validate`: Whether to validate the response against the expected schema.
+
+    > [dYdX API docs](https://docs.dydx.xyz/indexer-client/http#get-trades)
+    """
+    if starting_before_or_at_height is None:
+      starting_before_or_at_height = int((await self.get_height(validate=validate))['height'])
+    async def next(last_block: int) -> tuple[list[Trade], int | None]:
+      response = await self.get_trades(
+        market,
+        starting_before_or_at_height=last_block,
+        limit=limit,
+        validate=validate,
+      )
+      trades = response['trades']
+      if not trades:
+        return [], None
+      new_last_block = int(trades[-1]['createdAtHeight'])
+      if new_last_block == last_block:
+        # the whole page is the `last_block` trades: the walk can't get past that block
+        if len(trades) >= (limit or 1000):
+          if (limit or 1000) >= 1000:
+            raise ValueError(f'Block {last_block} has at least {len(trades)} trades, more than the max. page size: it can\'t be paged by height')
+          raise ValueError(f'Block {last_block} has at least {len(trades)} trades, more than a page: retry with a larger `limit` (max: 1000)')
+        return trades, None
+      return trades, new_last_block
+
+    return PaginatedResponse(starting_before_or_at_height, next)
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 from .api.get_transfers import GetTransfers, Transfer
+from .core import Validate
 
 @dataclass
 class GetTransfersPaged(GetTransfers):
@@ -14,7 +15,7 @@ class GetTransfersPaged(GetTransfers):
     created_before_or_at_height: int | None = None,
     created_before_or_at: datetime | None = None,
     limit: int | None = None,
-    validate: bool | None = None,
+    validate: Validate | None = None,
   ) -> AsyncIterable[list[Transfer]]:
     """Retrieves the transfer history for a specific subaccount.
 
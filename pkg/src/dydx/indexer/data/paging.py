@@ -0,0 +1,44 @@
+from typing_extensions import AsyncIterator, TypeVar
+from dataclasses import dataclass, field
+from collections import deque
+import asyncio
+
+from typed_core import PaginatedResponse, Page
+
+T = TypeVar('T')
+
+@dataclass
+class ConcurrentPaginatedResponse(PaginatedResponse[T, int]):
+  """Page-number walk keeping up to `concurrency` page requests in flight.
+
+  Pages are still yielded in order. Page `n + 1` is requested speculatively while page `n` is in flight, so the walk stops (and cancels what's left) at the first page whose `next` is `None`, i.e. the first short page.
+  """
+  concurrency: int = field(default=4, kw_only=True)
+
+  def __post_init__(self):
+    if self.concurrency < 1:
+      raise ValueError(f'concurrency must be at least 1, got {self.concurrency}')
+
+  async def pages(self) -> AsyncIterator[Page[T, int]]:
+    inflight: deque[tuple[int, asyncio.Task]] = deque()
+    upcoming = self.init
+    try:
+      while True:
+        while len(inflight) < self.concurrency:
+          inflight.append((upcoming, asyncio.ensure_future(self.next(upcoming))))
+          upcoming += 1
+        state, task = inflight.popleft()
+        rows, following = await task
+        yield Page(rows=rows, state=state, next=following)
+        if following is None:
+          return
+        elif not inflight or inflight[0][0] != following:
+          # drop speculative requests that don't match the walk, and carry on from `following`
+          for _, t in inflight:
+            t.cancel()
+          inflight.clear()
+          upcoming = following
+    finally:
+      for _, t in inflight:
+        t.cancel()
+      await asyncio.gather(*(t for _, t in inflight), return_exceptions=True)
@@ -0,0 +1,155 @@
+from typing_extensions import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import sqlite3
+import orjson
+
+from .core import coercer, parse_datetime
+from .api.get_candles import Candle
+from .api.get_historical_funding import Funding
+from .api.get_trades import Trade
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS candles (
+  market TEXT NOT NULL,
+  resolution TEXT NOT NULL,
+  started_at INTEGER NOT NULL,
+  data BLOB NOT NULL,
+  PRIMARY KEY (market, resolution, started_at)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS funding (
+  market TEXT NOT NULL,
+  height INTEGER NOT NULL,
+  data BLOB NOT NULL,
+  PRIMARY KEY (market, height)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trades (
+  market TEXT NOT NULL,
+  id TEXT NOT NULL,
+  height INTEGER NOT NULL,
+  data BLOB NOT NULL,
+  PRIMARY KEY (market, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trades_height ON trades (market, height);
+'''
+
+parse_candles = coercer(list[Candle])
+parse_funding = coercer(list[Funding])
+parse_trades = coercer(list[Trade])
+
+def epoch_ms(time: datetime | str) -> int:
+  if isinstance(time, str):
+    time = parse_datetime(time)
+  return round(time.timestamp() * 1000)
+
+def dump(row) -> bytes:
+  return orjson.dumps(row, default=str)
+
+def load(rows: Iterable[tuple[bytes]]) -> list:
+  return [orjson.loads(data) for data, in rows]
+
+@dataclass
+class Store:
+  """Local SQLite store of candles, historical funding and trades, keyed by market.
+
+  Rows are stored as received (`Decimal`s as strings), and parsed back on read.
+
+  ```python
+  store = Store('dydx.db')
+  async with Indexer.new() as indexer:
+    await indexer.data.sync(store, ['BTC-USD'], resolutions=['1MIN'], start=datetime(2025, 1, 1))
+  candles = store.candles('BTC-USD', '1MIN')
+  ```
+  """
+  path: str = ':memory:'
+  conn: sqlite3.Connection = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.conn = sqlite3.connect(self.path)
+    self.conn.executescript(SCHEMA)
+
+  def close(self):
+    self.conn.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  # Candles
+
+  def insert_candles(self, market: str, resolution: str, candles: Iterable[Candle]):
+    with self.conn:
+      self.conn.executemany(
+        'INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?)',
+        ((market, resolution, epoch_ms(c['startedAt']), dump(c)) for c in candles),
+      )
+
+  def last_candle_time(self, market: str, resolution: str) -> datetime | None:
+    """Start time of the latest stored candle."""
+    [(ms,)] = self.conn.execute(
+      'SELECT MAX(started_at) FROM candles WHERE market = ? AND resolution = ?', (market, resolution)
+    )
+    return None if ms is None else datetime.fromtimestamp(ms / 1000, timezone.utc)
+
+  def candles(
+    self, market: str, resolution: str, *,
+    start: datetime | None = None, end: datetime | None = None,
+  ) -> Sequence[Candle]:
+    """Stored candles with `start <= startedAt <= end`, in chronological order."""
+    rows = self.conn.execute(
+      'SELECT data FROM candles WHERE market = ? AND resolution = ? AND started_at BETWEEN ? AND ? ORDER BY started_at',
+      (market, resolution, epoch_ms(start) if start else 0, epoch_ms(end) if end else 2**62),
+    )
+    return parse_candles(load(rows)) # type: ignore
+
+  # Historical funding
+
+  def insert_funding(self, market: str, funding: Iterable[Funding]):
+    with self.conn:
+      self.conn.executemany(
+        'INSERT OR REPLACE INTO funding VALUES (?, ?, ?)',
+        ((market, int(f['effectiveAtHeight']), dump(f)) for f in funding),
+      )
+
+  def last_funding_height(self, market: str) -> int | None:
+    """`effectiveAtHeight` of the latest stored funding rate."""
+    [(height,)] = self.conn.execute('SELECT MAX(height) FROM funding WHERE market = ?', (market,))
+    return height
+
+  def funding(
+    self, market: str, *,
+    start_height: int | None = None, end_height: int | None = None,
+  ) -> Sequence[Funding]:
+    """Stored funding rates with `start_height <= effectiveAtHeight <= end_height`, in chronological order."""
+    rows = self.conn.execute(
+      'SELECT data FROM funding WHERE market = ? AND height BETWEEN ? AND ? ORDER BY height',
+      (market, start_height or 0, 2**62 if end_height is None else end_height),
+    )
+    return parse_funding(load(rows)) # type: ignore
+
+  # Trades
+
+  def insert_trades(self, market: str, trades: Iterable[Trade]):
+    with self.conn:
+      self.conn.executemany(
+        'INSERT OR REPLACE INTO trades VALUES (?, ?, ?, ?)',
+        ((market, t['id'], int(t['createdAtHeight']), dump(t)) for t in trades),
+      )
+
+  def last_trade_height(self, market: str) -> int | None:
+    """`createdAtHeight` of the latest stored trade."""
+    [(height,)] = self.conn.execute('SELECT MAX(height) FROM trades WHERE market = ?', (market,))
+    return height
+
+  def trades(
+    self, market: str, *,
+    start_height: int | None = None, end_height: int | None = None,
+  ) -> Sequence[Trade]:
+    """Stored trades with `start_height <= createdAtHeight <= end_height`, in chronological order."""
+    rows = self.conn.execute(
+      'SELECT data FROM trades WHERE market = ? AND height BETWEEN ? AND ? ORDER BY height, id',
+      (market, start_height or 0, 2**62 if end_height is None else end_height),
+    )
+    return parse_trades(load(rows)) # type: ignore
@@ -0,0 +1,123 @@
+from typing_extensions import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
+
+from .get_candles_paged import GetCandlesPaged, Resolution, utc
+from .get_historical_funding_paged import GetHistoricalFundingPaged
+from .get_trades_paged import GetTradesPaged
+from .store import Store
+
+def throttled(semaphore: asyncio.Semaphore | None):
+  """Page fetch invoker (see `PaginatedResponse.via`) holding `semaphore` during each request."""
+  async def call(fetch):
+    if semaphore is None:
+      return await fetch()
+    async with semaphore:
+      return await fetch()
+  return call
+
+@dataclass
+class Sync(GetCandlesPaged, GetHistoricalFundingPaged, GetTradesPaged):
+  async def sync_candles(
+    self, store: Store, market: str, resolution: Resolution, *,
+    start: datetime, concurrency: int = 4, semaphore: asyncio.Semaphore | None = None,
+  ) -> int:
+    """Fetches the candles newer than the latest stored one (or since `start`, if there are none) into `store`. Returns the number of candles fetched.
+
+    The latest stored candle is fetched again, since it may have been stored while still open.
+
+    - `store`: The local store.
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `resolution`: The resolution of the candles.
+    - `start`: Where to start from, when no candles are stored yet (naive datetimes are taken as local time).
+    - `concurrency`: The max. number of requests in flight.
+    - `semaphore`: If given, held during each request (e.g. to share a request budget across syncs).
+    """
+    last = store.last_candle_time(market, resolution)
+    count = 0
+    backfill = self.get_candles_backfill(market, resolution, start=utc(last or start), concurrency=concurrency)
+    async for candles in backfill.via(throttled(semaphore)):
+      store.insert_candles(market, resolution, candles)
+      count += len(candles)
+    return count
+
+  async def sync_historical_funding(self, store: Store, market: str, *, semaphore: asyncio.Semaphore | None = None) -> int:
+    """Fetches the funding rates newer than the latest stored one (or the whole history, if there are none) into `store`. Returns the number of funding rates fetched.
+
+    The walk goes newest first, so its rows are only stored once it completes: an interrupted sync stores nothing (rather than leaving a hole below the rows it got), and starts over next time.
+
+    - `store`: The local store.
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `semaphore`: If given, held during each request.
+    """
+    last = store.last_funding_height(market)
+    rows = []
+    async for funding in self.get_historical_funding_paged(market).via(throttled(semaphore)):
+      new = funding if last is None else [f for f in funding if int(f['effectiveAtHeight']) > last]
+      rows.extend(new)
+      if len(new) < len(funding):
+        break
+    store.insert_funding(market, rows)
+    return len(rows)
+
+  async def sync_trades(
+    self, store: Store, market: str, *,
+    start_height: int | None = None, semaphore: asyncio.Semaphore | None = None,
+  ) -> int:
+    """Fetches the trades newer than the latest stored one into `store`. Returns the number of trades fetched.
+
+    As with `sync_historical_funding`, the trades are only stored once the (newest first) walk completes.
+
+    - `store`: The local store.
+    - `market`: The market ticker (e.g. `'BTC-USD'`).
+    - `start_height`: Where to start from, when no trades are stored yet. If not given either, only the latest page of trades is fetched.
+    - `semaphore`: If given, held during each request.
+    """
+    last = store.last_trade_height(market)
+    if last is None:
+      last = start_height
+    rows = []
+    async for trades in (await self.get_trades_paged(market)).via(throttled(semaphore)):
+      # trades of the `last` block are fetched again: it may have been stored partially
+      new = trades if last is None else [t for t in trades if int(t['createdAtHeight']) >= last]
+      rows.extend(new)
+      if last is None or len(new) < len(trades):
+        break
+    store.insert_trades(market, rows)
+    return len(rows)
+
+  async def sync(
+    self, store: Store, markets: Sequence[str], *,
+    resolutions: Sequence[Resolution] = (),
+    start: datetime | None = None,
+    funding: bool = True,
+    trades: bool = False,
+    trades_start_height: int | None = None,
+    concurrency: int = 8,
+  ):
+    """Brings `store` up to date for the given markets, fetching only what's newer than what's stored.
+
+    - `store`: The local store.
+    - `markets`: The market tickers (e.g. `['BTC-USD', 'ETH-USD']`).
+    - `resolutions`: The candle resolutions to sync.
+    - `start`: Where to start candles from, when none are stored yet (naive datetimes are taken as local time). Required if `resolutions` are given.
+    - `funding`: Whether to sync historical funding rates.
+    - `trades`: Whether to sync trades.
+    - `trades_start_height`: Where to start trades from, when none are stored yet (see `sync_trades`).
+    - `concurrency`: The max. number of requests in flight, across all markets and resolutions.
+    """
+    if resolutions and start is None:
+      raise ValueError('`start` is required to sync candles')
+    if concurrency < 1:
+      raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+    for market in markets:
+      for resolution in resolutions:
+        tasks.append(self.sync_candles(store, market, resolution, start=start, semaphore=semaphore)) # type: ignore
+      if funding:
+        tasks.append(self.sync_historical_funding(store, market, semaphore=semaphore))
+      if trades:
+        tasks.append(self.sync_trades(store, market, start_height=trades_start_height, semaphore=semaphore))
+    await asyncio.gather(*tasks)
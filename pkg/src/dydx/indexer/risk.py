@@ -0,0 +1,246 @@
+"""Vectorized margin calculations over many subaccounts, built with NumPy (`pip install typed-dydx[numpy]`).
+
+Amounts are `float64`: fine for risk monitoring, not for exact accounting.
+"""
+from typing_extensions import TYPE_CHECKING, Hashable, Mapping, NamedTuple
+from dataclasses import dataclass, field
+
+from dydx.core import numpy
+from dydx.indexer.types import PerpetualMarket
+from dydx.indexer.streams.api.markets import Notification as MarketsNotification
+from dydx.indexer.streams.subaccounts import SubaccountState
+from dydx.indexer.streams.parent_subaccounts import QUOTE_SYMBOL, signed_size
+
+if TYPE_CHECKING:
+  import numpy as np
+
+def grow(array: 'np.ndarray', size: int) -> 'np.ndarray':
+  """`array`, zero-padded to at least `size` elements (doubling its capacity)."""
+  if size <= len(array):
+    return array
+  np = numpy()
+  out = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+  out[:len(array)] = array
+  return out
+
+class AccountRisk(NamedTuple):
+  equity: float
+  initial_margin: float
+  maintenance_margin: float
+  free_collateral: float
+
+@dataclass
+class RiskCalculator:
+  """Equity, margin requirements, free collateral and liquidation prices of many subaccounts (cross margin), kept as arrays.
+
+  ```python
+  risk = RiskCalculator.of(registry.markets)
+  risk.load(('main', 0), subaccount_state)
+  async for msg in markets_stream:
+    risk.apply(msg)
+    print(risk.account(('main', 0)), risk.liquidation_prices())
+  ```
+
+  Positions are rows (one per account and market). A price update only recomputes the rows of the markets whose price changed, and adjusts their accounts' totals by the difference.
+  """
+  market_index: dict[str, int] = field(default_factory=dict)
+  """Market row, by ticker."""
+  account_index: dict[Hashable, int] = field(default_factory=dict)
+  """Account row, by key (any hashable, e.g. `(address, subaccount_number)`)."""
+  row_index: dict[tuple[int, int], int] = field(default_factory=dict, repr=False)
+  """Position row, by `(account, market)`."""
+  market_rows: dict[int, list[int]] = field(default_factory=dict, repr=False)
+  """Position rows, by market."""
+  price: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  imf: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """Initial margin fraction, by market."""
+  mmf: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """Maintenance margin fraction, by market."""
+  quote: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """USDC balance, by account."""
+  position_value: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  initial_margin: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  maintenance_margin: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  row_account: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  row_market: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  size: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """Signed size, by position."""
+  value: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """`size * price`, by position."""
+  im: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """Initial margin, by position."""
+  mm: 'np.ndarray' = field(default=None, repr=False) # type: ignore
+  """Maintenance margin, by position."""
+
+  def __post_init__(self):
+    np = numpy()
+    for name in ('price', 'imf', 'mmf', 'quote', 'position_value', 'initial_margin', 'maintenance_margin', 'size', 'value', 'im', 'mm'):
+      if getattr(self, name) is None:
+        setattr(self, name, np.zeros(0, dtype=np.float64))
+    for name in ('row_account', 'row_market'):
+      if getattr(self, name) is None:
+        setattr(self, name, np.zeros(0, dtype=np.int64))
+
+  @classmethod
+  def of(cls, markets: Mapping[str, PerpetualMarket]) -> 'RiskCalculator':
+    """Calculator for `markets` (e.g. `MarketRegistry.markets` or `get_markets()['markets']`)."""
+    calc = cls()
+    for market in markets.values():
+      calc.set_market(market)
+    return calc
+
+  @property
+  def accounts(self) -> int:
+    return len(self.account_index)
+
+  @property
+  def rows(self) -> int:
+    return len(self.row_index)
+
+  def market_row(self, ticker: str) -> int:
+    if (i := self.market_index.get(ticker)) is None:
+      i = self.market_index[ticker] = len(self.market_index)
+      for name in ('price', 'imf', 'mmf'):
+        setattr(self, name, grow(getattr(self, name), i + 1))
+    return i
+
+  def account_row(self, account: Hashable) -> int:
+    if (i := self.account_index.get(account)) is None:
+      i = self.account_index[account] = len(self.account_index)
+      for name in ('quote', 'position_value', 'initial_margin', 'maintenance_margin'):
+        setattr(self, name, grow(getattr(self, name), i + 1))
+    return i
+
+  def position_row(self, account: int, market: int) -> int:
+    if (i := self.row_index.get((account, market))) is None:
+      i = self.row_index[(account, market)] = len(self.row_index)
+      for name in ('row_account', 'row_market', 'size', 'value', 'im', 'mm'):
+        setattr(self, name, grow(getattr(self, name), i + 1))
+      self.row_account[i] = account
+      self.row_market[i] = market
+      self.market_rows.setdefault(market, []).append(i)
+    return i
+
+  def set_market(self, market: PerpetualMarket):
+    """Set (or update) a market's margin fractions and oracle price."""
+    i = self.market_row(market['ticker'])
+    self.imf[i] = float(market['initialMarginFraction'])
+    self.mmf[i] = float(market['maintenanceMarginFraction'])
+    if market.get('oraclePrice') is not None:
+      self.price[i] = float(market['oraclePrice'])
+    self.reprice(self.rows_of([i]))
+
+  def set_quote(self, account: Hashable, balance: float):
+    i = self.account_row(account)
+    self.quote[i] = float(balance)
+
+  def set_position(self, account: Hashable, ticker: str, size: float):
+    """Set the signed size of a position (`0` to close it)."""
+    a, m = self.account_row(account), self.market_row(ticker)
+    row = self.position_row(a, m)
+    self.size[row] = float(size)
+    self.reprice(numpy().array([row]))
+
+  def load(self, account: Hashable, state: SubaccountState):
+    """Set an account's USDC balance and positions from a `SubaccountState` (closing those it no longer has)."""
+    self.set_quote(account, float(signed_size(state.asset_positions.get(QUOTE_SYMBOL))))
+    a = self.account_row(account)
+    tickers = {t for t, m in self.market_index.items() if (a, m) in self.row_index}
+    for ticker in tickers - state.positions.keys():
+      self.set_position(account, ticker, 0)
+    for ticker, position in state.positions.items():
+      self.set_position(account, ticker, float(signed_size(position)))
+
+  def rows_of(self, markets) -> 'np.ndarray':
+    """Rows of positions in `markets` (market rows)."""
+    np = numpy()
+    return np.array([row for m in markets for row in self.market_rows.get(m, ())], dtype=np.int64)
+
+  def reprice(self, rows: 'np.ndarray'):
+    """Recompute the value and margins of `rows`, adjusting their accounts' totals by the change."""
+    if not len(rows):
+      return
+    np = numpy()
+    markets = self.row_market[rows]
+    accounts = self.row_account[rows]
+    value = self.size[rows] * self.price[markets]
+    im = np.abs(value) * self.imf[markets]
+    mm = np.abs(value) * self.mmf[markets]
+    n = self.accounts
+    self.position_value[:n] += np.bincount(accounts, weights=value - self.value[rows], minlength=n)
+    self.initial_margin[:n] += np.bincount(accounts, weights=im - self.im[rows], minlength=n)
+    self.maintenance_margin[:n] += np.bincount(accounts, weights=mm - self.mm[rows], minlength=n)
+    self.value[rows] = value
+    self.im[rows] = im
+    self.mm[rows] = mm
+
+  def recompute(self):
+    """Recompute every position and account total from scratch (e.g. to clear accumulated rounding)."""
+    np = numpy()
+    n = self.accounts
+    for name in ('position_value', 'initial_margin', 'maintenance_margin'):
+      getattr(self, name)[:n] = 0
+    rows = self.rows
+    self.value[:rows] = self.im[:rows] = self.mm[:rows] = 0
+    self.reprice(np.arange(rows))
+
+  def update_prices(self, prices: Mapping[str, object]) -> 'np.ndarray':
+    """Set oracle prices (by ticker), recomputing only the positions of markets whose price changed. Returns the recomputed rows."""
+    np = numpy()
+    changed = []
+    for ticker, price in prices.items():
+      if (i := self.market_index.get(ticker)) is not None:
+        p = float(price) # type: ignore
+        if p != self.price[i]:
+          self.price[i] = p
+          changed.append(i)
+    rows = self.rows_of(changed) if changed else np.zeros(0, dtype=np.int64)
+    self.reprice(rows)
+    return rows
+
+  def apply(self, notification: MarketsNotification) -> 'np.ndarray':
+    """Apply a `v4_markets` stream update: oracle prices, and margin fraction changes. Returns the recomputed rows."""
+    np = numpy()
+    rows = [np.zeros(0, dtype=np.int64)]
+    for ticker, delta in (notification.get('trading') or {}).items():
+      imf, mmf = delta.get('initialMarginFraction'), delta.get('maintenanceMarginFraction')
+      if (imf is not None or mmf is not None) and (i := self.market_index.get(ticker)) is not None:
+        if imf is not None:
+          self.imf[i] = float(imf)
+        if mmf is not None:
+          self.mmf[i] = float(mmf)
+        rows.append(self.rows_of([i]))
+        self.reprice(rows[-1])
+    if (prices := notification.get('oraclePrices')):
+      rows.append(self.update_prices({ticker: p['oraclePrice'] for ticker, p in prices.items()}))
+    return np.concatenate(rows)
+
+  def equity(self) -> 'np.ndarray':
+    """Equity, by account: USDC balance plus position values."""
+    n = self.accounts
+    return self.quote[:n] + self.position_value[:n]
+
+  def free_collateral(self) -> 'np.ndarray':
+    """Free collateral, by account: equity minus initial margin."""
+    return self.equity() - self.initial_margin[:self.accounts]
+
+  def liquidation_prices(self) -> 'np.ndarray':
+    """Liquidation price, by position row: the price at which its account's equity falls to its maintenance margin (other prices unchanged). `nan` for closed positions, `0` if never."""
+    np = numpy()
+    n = self.rows
+    size, markets, accounts = self.size[:n], self.row_market[:n], self.row_account[:n]
+    buffer = (self.equity() - self.maintenance_margin[:self.accounts])[accounts]
+    slope = size - np.abs(size) * self.mmf[markets]
+    with np.errstate(divide='ignore', invalid='ignore'):
+      out = self.price[markets] - buffer / slope
+    out[size == 0] = np.nan
+    return np.maximum(out, 0, where=~np.isnan(out), out=out)
+
+  def account(self, account: Hashable) -> AccountRisk:
+    i = self.account_index[account]
+    equity = float(self.quote[i] + self.position_value[i])
+    return AccountRisk(
+      equity=equity, initial_margin=float(self.initial_margin[i]),
+      maintenance_margin=float(self.maintenance_margin[i]),
+      free_collateral=equity - float(self.initial_margin[i]),
+    )
@@ -1,20 +1,21 @@
 from dataclasses import dataclass
 
-from .core import INDEXER_WS_URL, INDEXER_TESTNET_WS_URL
+from .core import INDEXER_WS_URL, INDEXER_TESTNET_WS_URL, StreamsClient
+from .sharded import ShardedStreamsClient, ShardStats
 from .api.block_height import BlockHeight
-from .candles import Candles
-from .api.markets import Markets
-from .api.orders import Orders
-from .parent_subaccounts import ParentSubaccounts
-from .subaccounts import Subaccounts
-from .api.trades import Trades
+from .candles import Candles, CandleBuilder, LocalCandle
+from .markets import Markets, MarketRegistry
+from .orderbook import OrderBooks, OrderBook
+from .parent_subaccounts import ParentSubaccounts, ParentSubaccountState
+from .subaccounts import Subaccounts, SubaccountState, SubaccountSnapshot
+from .trades import Trades, TradeTape
 
 @dataclass
 class IndexerStreams(
   BlockHeight,
   Candles,
   Markets,
-  Orders,
+  OrderBooks,
   ParentSubaccounts,
   Subaccounts,
   Trades,
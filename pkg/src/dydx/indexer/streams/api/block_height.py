@@ -1,4 +1,4 @@
-from typing_extensions import AsyncIterable, TypedDict
+from typing_extensions import TypedDict
 from dataclasses import dataclass
 from datetime import datetime
 import pydantic
@@ -15,7 +15,6 @@ class Notification(TypedDict):
   time: datetime
 
 reply_adapter = pydantic.TypeAdapter(Reply)
-notification_adapter = pydantic.TypeAdapter(Notification)
 
 @dataclass
 class BlockHeight(StreamsMixin):
@@ -30,16 +29,8 @@ class BlockHeight(StreamsMixin):
 
     > [Official API docs](https://docs.dydx.xyz/indexer-client/websockets#block-height)
     """
-    stream = await self.client.subscribe('v4_block_height', {'batched': batched})
-
-    async def parsed_stream() -> AsyncIterable[Notification]:
-      async for msg in stream:
-        data = msg['contents']
-        msgs: list[Notification] = data if batched else [data]
-        for d in msgs:
-          yield notification_adapter.validate_python(d) if self.validate(validate) else d
-
-    c = stream.reply['contents']
-    reply: Reply = reply_adapter.validate_python(c) if self.validate(validate) else c
-    return Stream(reply, parsed_stream(), stream.unsubscribe)
+    return await self.subscribe_parsed(
+      'v4_block_height', batched=batched, validate=validate,
+      reply=reply_adapter, notification=Notification,
+    )
 
@@ -1,4 +1,4 @@
-from typing_extensions import Any, AsyncIterable, NotRequired, TypedDict, NamedTuple
+from typing_extensions import Any, NotRequired, TypedDict, NamedTuple
 from dataclasses import dataclass
 from decimal import Decimal
 import pydantic
@@ -23,7 +23,6 @@ class Reply(TypedDict):
   asks: list[BookEntry]
 
 reply_adapter = pydantic.TypeAdapter(Reply)
-notification_adapter = pydantic.TypeAdapter(Notification)
 
 @dataclass
 class Orders(StreamsMixin):
@@ -39,16 +38,8 @@ class Orders(StreamsMixin):
 
     > [Official API docs](https://docs.dydx.xyz/indexer-client/websockets#orders)
     """
-    stream = await self.client.subscribe(f'v4_orderbook:{id}', {'batched': batched})
-
-    async def parsed_stream() -> AsyncIterable[Notification]:
-      async for msg in stream:
-        data = msg['contents']
-        msgs: list[Notification] = data if batched else [data]
-        for d in msgs:
-          yield notification_adapter.validate_python(d) if self.validate(validate) else d
-
-    c = stream.reply['contents']
-    reply: Reply = reply_adapter.validate_python(c) if self.validate(validate) else c
-    return Stream(reply, parsed_stream(), stream.unsubscribe)
+    return await self.subscribe_parsed(
+      f'v4_orderbook:{id}', batched=batched, validate=validate,
+      reply=reply_adapter, notification=Notification,
+    )
 
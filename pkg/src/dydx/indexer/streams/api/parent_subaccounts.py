@@ -1,4 +1,4 @@
-from typing_extensions import AsyncIterable, Literal, NotRequired, TypedDict
+from typing_extensions import Literal, NotRequired, TypedDict
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -190,7 +190,6 @@ class Reply(TypedDict):
   blockHeight: str
 
 reply_adapter = pydantic.TypeAdapter(Reply)
-notification_adapter = pydantic.TypeAdapter(Notification)
 
 @dataclass
 class ParentSubaccounts(StreamsMixin):
@@ -206,16 +205,8 @@ class ParentSubaccounts(StreamsMixin):
 
     > [Official API docs](https://docs.dydx.xyz/indexer-client/websockets#parent-subaccounts)
     """
-    stream = await self.client.subscribe(f'v4_parent_subaccounts:{id}', {'batched': batched})
-
-    async def parsed_stream() -> AsyncIterable[Notification]:
-      async for msg in stream:
-        data = msg['contents']
-        msgs: list[Notification] = data if batched else [data]
-        for d in msgs:
-          yield notification_adapter.validate_python(d) if self.validate(validate) else d
-
-    c = stream.reply['contents']
-    reply: Reply = reply_adapter.validate_python(c) if self.validate(validate) else c
-    return Stream(reply, parsed_stream(), stream.unsubscribe)
+    return await self.subscribe_parsed(
+      f'v4_parent_subaccounts:{id}', batched=batched, validate=validate,
+      reply=reply_adapter, notification=Notification,
+    )
 
@@ -1,13 +1,157 @@
-from typing_extensions import Literal
-from dataclasses import dataclass
+from typing_extensions import AsyncIterable, Literal, NotRequired, Sequence, TypedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
 
-from .api.candles import Candles as CandlesAPI
+from typed_core.util import Stream
+from dydx.indexer.data.core import parse_datetime
+from dydx.indexer.data.get_candles_paged import RESOLUTIONS, EPOCH
+from .core import Unsubscribed
+from .api.candles import Candles as CandlesAPI, Candle
+from .api.trades import Trades, Trade, TradeUpdate
 
 Resolution = Literal['1MIN', '5MINS', '15MINS', '30MINS', '1HOUR', '4HOURS', '1DAY']
 
+class LocalCandle(TypedDict):
+  """Candle built locally (see `CandleBuilder`). Same fields as the indexer's `Candle`, except for `startingOpenInterest` (only set when rolled up from candles) and the order book mid prices."""
+  startedAt: datetime
+  ticker: str
+  resolution: str
+  open: Decimal
+  high: Decimal
+  low: Decimal
+  close: Decimal
+  baseTokenVolume: Decimal
+  usdVolume: Decimal
+  trades: int
+  startingOpenInterest: NotRequired[Decimal]
+
+def interval_of(resolution: Resolution | timedelta) -> timedelta:
+  return RESOLUTIONS[resolution] if isinstance(resolution, str) else resolution
+
+def label(resolution: Resolution | timedelta) -> str:
+  """Name of a resolution: itself for the indexer's, else e.g. `'5SECS'` or `'2MINS'`."""
+  if isinstance(resolution, str):
+    return resolution
+  seconds = resolution.total_seconds()
+  if seconds % 60 == 0:
+    return f'{int(seconds // 60)}MINS'
+  return f'{seconds:g}SECS'
+
+def time_of(x: datetime | str) -> datetime:
+  return parse_datetime(x) if isinstance(x, str) else x
+
+@dataclass
+class CandleBuilder:
+  """Builds candles of any resolution, from trades or from (shorter) candles.
+
+  ```python
+  builder = CandleBuilder('BTC-USD', timedelta(seconds=5))
+  for candle in builder.add_trades(notification['trades']):
+    print(candle) # closed 5 seconds candle
+  ```
+
+  - From trades (`add_trades`), e.g. of the `v4_trades` stream, for resolutions the indexer doesn't provide.
+  - From candles (`add_candle`), e.g. rolling `1MIN` candles up into `1HOUR` ones. Updates of the latest candle (same `startedAt`) replace it.
+
+  Updates are `O(1)`. Trades or candles older than the current candle are ignored (late trades within it only count towards its high, low and volumes). Candles without trades aren't emitted.
+  """
+  ticker: str
+  resolution: Resolution | timedelta
+  interval: timedelta = field(init=False, repr=False)
+  name: str = field(init=False, repr=False)
+  current: LocalCandle | None = field(default=None, init=False)
+  """The open candle (including the latest piece)."""
+  base: LocalCandle | None = field(default=None, init=False, repr=False)
+  """The open candle, without the latest piece (which may still be revised)."""
+  last_time: datetime | None = field(default=None, init=False, repr=False)
+  """Time of the latest piece."""
+  closed_until: datetime | None = field(default=None, init=False, repr=False)
+  """End of the latest candle closed by `close` (later pieces before it are ignored)."""
+
+  def __post_init__(self):
+    self.interval = interval_of(self.resolution)
+    if self.interval <= timedelta(0):
+      raise ValueError(f'Invalid resolution: {self.resolution}')
+    self.name = label(self.resolution)
+
+  def start_of(self, time: datetime) -> datetime:
+    return time - (time - EPOCH) % self.interval
+
+  def fold(self, candle: LocalCandle | None, piece: LocalCandle, *, late: bool = False) -> LocalCandle:
+    if candle is None:
+      return piece
+    out: LocalCandle = {
+      **candle, # type: ignore
+      'high': max(candle['high'], piece['high']),
+      'low': min(candle['low'], piece['low']),
+      'close': candle['close'] if late else piece['close'],
+      'baseTokenVolume': candle['baseTokenVolume'] + piece['baseTokenVolume'],
+      'usdVolume': candle['usdVolume'] + piece['usdVolume'],
+      'trades': candle['trades'] + piece['trades'],
+    }
+    return out
+
+  def add(self, time: datetime, piece: LocalCandle, *, revisable: bool) -> LocalCandle | None:
+    """Add a piece (a trade or a shorter candle) starting at `time`. Returns the candle it closed, if any."""
+    start = self.start_of(time)
+    if self.closed_until is not None and start < self.closed_until:
+      return None
+    closed = None
+    if self.current is not None:
+      current_start = self.current['startedAt']
+      if start < current_start:
+        return None
+      if start > current_start:
+        closed, self.current, self.base, self.last_time = self.current, None, None, None
+    late = self.last_time is not None and time < self.last_time
+    if revisable and late:
+      return closed
+    if not (revisable and time == self.last_time):
+      self.base = self.current
+    piece = {**piece, 'startedAt': start, 'ticker': self.ticker, 'resolution': self.name} # type: ignore
+    self.current = self.fold(self.base, piece, late=late)
+    if not late:
+      self.last_time = time
+    return closed
+
+  def add_trade(self, trade: Trade | TradeUpdate) -> LocalCandle | None:
+    """Add a trade. Returns the candle it closed, if any."""
+    price, size = Decimal(trade['price']), Decimal(trade['size'])
+    return self.add(time_of(trade['createdAt']), {
+      'open': price, 'high': price, 'low': price, 'close': price,
+      'baseTokenVolume': size, 'usdVolume': size * price, 'trades': 1,
+    }, revisable=False) # type: ignore
+
+  def add_trades(self, trades: Sequence[Trade | TradeUpdate]) -> list[LocalCandle]:
+    """Add trades (in any order, e.g. a stream update, which lists the newest first). Returns the candles they closed."""
+    closed = []
+    for trade in sorted(trades, key=lambda t: time_of(t['createdAt'])):
+      if (candle := self.add_trade(trade)) is not None:
+        closed.append(candle)
+    return closed
+
+  def add_candle(self, candle: Candle | LocalCandle) -> LocalCandle | None:
+    """Add (or update, if it has the same `startedAt` as the latest one) a shorter candle. Returns the candle it closed, if any."""
+    piece: LocalCandle = {
+      'open': Decimal(candle['open']), 'high': Decimal(candle['high']),
+      'low': Decimal(candle['low']), 'close': Decimal(candle['close']),
+      'baseTokenVolume': Decimal(candle['baseTokenVolume']), 'usdVolume': Decimal(candle['usdVolume']),
+      'trades': int(candle['trades']),
+    } # type: ignore
+    if candle.get('startingOpenInterest') is not None:
+      piece['startingOpenInterest'] = Decimal(candle['startingOpenInterest']) # type: ignore
+    return self.add(time_of(candle['startedAt']), piece, revisable=True)
+
+  def close(self, now: datetime) -> LocalCandle | None:
+    """Close the open candle if `now` is past its end (e.g. on a timer, since candles otherwise close on the next trade)."""
+    if self.current is not None and now >= self.current['startedAt'] + self.interval:
+      self.closed_until = self.current['startedAt'] + self.interval
+      closed, self.current, self.base, self.last_time = self.current, None, None, None
+      return closed
 
 @dataclass
-class Candles(CandlesAPI):
+class Candles(CandlesAPI, Trades):
   async def candles(
     self,
     market: str,
@@ -22,3 +166,62 @@ class Candles(CandlesAPI):
       batched=batched,
       validate=validate,
     )
+
+  async def trade_candles(
+    self, market: str, *, resolutions: Sequence[Resolution | timedelta],
+    validate: bool | None = None, batched: bool = True,
+  ) -> Stream[list[LocalCandle], dict[str, CandleBuilder], Unsubscribed]:
+    """Build candles of any `resolutions` (e.g. `timedelta(seconds=5)`) from a market's trades stream.
+
+    The stream's `reply` is the builders by resolution name (see `label`), whose `current` is the open candle. Each notification yields the candles it closed, if any.
+
+    The subscription's recent trades are used to start, but the first candles may still miss older trades.
+
+    - `market`: Market ticker.
+    - `resolutions`: Candle resolutions to build.
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    """
+    builders = {label(r): CandleBuilder(market, r) for r in resolutions}
+    stream = await self.trades(id=market, batched=batched, validate=validate)
+    for builder in builders.values():
+      builder.add_trades(stream.reply['trades'])
+
+    async def updates() -> AsyncIterable[list[LocalCandle]]:
+      async for msg in stream:
+        if closed := [c for b in builders.values() for c in b.add_trades(msg['trades'])]:
+          yield closed
+
+    return Stream(builders, updates(), stream.unsubscribe)
+
+  async def rolled_candles(
+    self, market: str, *, resolutions: Sequence[Resolution | timedelta] = ('5MINS', '15MINS', '30MINS', '1HOUR', '4HOURS', '1DAY'),
+    validate: bool | None = None, batched: bool = True,
+  ) -> Stream[list[LocalCandle], dict[str, CandleBuilder], Unsubscribed]:
+    """Roll a market's `1MIN` candles up into longer `resolutions`, with a single subscription.
+
+    The stream's `reply` is the builders by resolution name, whose `current` is the open candle. Each notification yields the candles it closed, if any.
+
+    The subscription's recent candles are used to start, but the first candles may still miss older minutes.
+
+    - `market`: Market ticker.
+    - `resolutions`: Candle resolutions to build (multiples of one minute).
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    """
+    builders = {label(r): CandleBuilder(market, r) for r in resolutions}
+    for name, builder in builders.items():
+      if builder.interval % RESOLUTIONS['1MIN']:
+        raise ValueError(f'Resolution {name} is not a multiple of 1MIN')
+    stream = await self.candles(market, resolution='1MIN', batched=batched, validate=validate)
+    history = sorted(stream.reply['candles'], key=lambda c: time_of(c['startedAt']))
+    for builder in builders.values():
+      for candle in history:
+        builder.add_candle(candle)
+
+    async def updates() -> AsyncIterable[list[LocalCandle]]:
+      async for msg in stream:
+        if closed := [c for b in builders.values() if (c := b.add_candle(msg)) is not None]:
+          yield closed
+
+    return Stream(builders, updates(), stream.unsubscribe)
@@ -1,15 +1,24 @@
-from typing_extensions import Literal, Any, NotRequired, TypedDict
+from typing_extensions import TYPE_CHECKING, AsyncIterable, Awaitable, Iterable, Literal, Any, Callable, NotRequired, Sequence, TypedDict, TypeVar
 from dataclasses import dataclass, field
+from functools import cache
 import asyncio
 import logging
+import re
 import orjson
 import pydantic
 
 from typed_core import LogicError, BadRequest
+from typed_core.util import Stream
 from typed_core.ws.streams import Streams, Subscription
+from typed_core.ws.socket import fail_replies
+
+if TYPE_CHECKING:
+  from .sharded import ShardedStreamsClient
 
 logger = logging.getLogger('dydx.indexer.streams')
 
+S = TypeVar('S')
+
 INDEXER_WS_URL = 'wss://indexer.dydx.trade/v4/ws'
 INDEXER_TESTNET_WS_URL = 'wss://indexer.v4testnet.dydx.exchange/v4/ws'
 
@@ -40,9 +49,34 @@ class Notification(BaseMessage, Channel):
   contents: Any
 
 Msg = Connected | Subscribed | Unsubscribed | Error | Notification
-MsgT: type[Msg] = Msg # type: ignore
 
-msg_adapter = pydantic.TypeAdapter(MsgT)
+@cache
+def frame_adapter(contents_type: Any) -> pydantic.TypeAdapter[Notification]:
+  """Adapter for a whole notification frame with typed `contents`, to validate it in a single pass (straight from the raw message)."""
+  class Frame(BaseMessage):
+    type: Literal['channel_data', 'channel_batch_data']
+    channel: str
+    id: NotRequired[str]
+    version: str
+    contents: contents_type # type: ignore
+  return pydantic.TypeAdapter(Frame) # type: ignore
+
+HEADER_FIELD = re.compile(r'"(type|channel|id)"\s*:\s*"([^"]*)"')
+HEADER_FIELD_BYTES = re.compile(HEADER_FIELD.pattern.encode())
+
+def peek(msg: str | bytes) -> dict[str, str]:
+  """The `type`, `channel` and `id` fields of a message, read from its header (before `contents`) without decoding it.
+
+  Fields that come after `contents` (or are missing) aren't returned.
+  """
+  if isinstance(msg, bytes):
+    end = msg.find(b'"contents"')
+    fields = HEADER_FIELD_BYTES.finditer(msg, 0, len(msg) if end < 0 else end)
+    return {k.decode(): v.decode() for k, v in (m.groups() for m in fields)}
+  else:
+    end = msg.find('"contents"')
+    fields = HEADER_FIELD.finditer(msg, 0, len(msg) if end < 0 else end)
+    return dict(m.groups() for m in fields) # type: ignore
 
 class Params(TypedDict, total=False):
   batched: bool
@@ -60,29 +94,122 @@ def channel_id(msg: Channel) -> str:
     out += f':{id}'
   return out
 
+async def subscribe_all(subscriptions: Iterable[Awaitable[Stream[Notification, Subscribed, Unsubscribed]]]) -> list[Stream[Notification, Subscribed, Unsubscribed]]:
+  """Await `subscriptions` concurrently. If any fails, the others are unsubscribed and the (first) error is raised."""
+  results = await asyncio.gather(*subscriptions, return_exceptions=True)
+  if errors := [r for r in results if isinstance(r, BaseException)]:
+    await asyncio.gather(*(r.unsubscribe() for r in results if not isinstance(r, BaseException)), return_exceptions=True)
+    raise errors[0]
+  return results # type: ignore
+
 @dataclass
 class StreamsClient(Streams[Notification, Params, Subscribed, Unsubscribed]):
   url: str = INDEXER_WS_URL
-  lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
-  replies: asyncio.Queue[Error | Subscribed | Unsubscribed] = field(default_factory=asyncio.Queue)
+  pending: dict[tuple[str, str], asyncio.Future[Error | Subscribed | Unsubscribed]] = field(default_factory=dict, init=False, repr=False)
+  """Requests awaiting their reply, keyed by `(reply type, channel id)`, in the order they were sent."""
+  last_message_id: int | None = field(default=None, init=False, repr=False)
+  """Last `message_id` received on the current connection (they're consecutive per connection)."""
+  channel_message_ids: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+  """Last `message_id` received per channel."""
+  gap_handlers: dict[str, Callable[[], Any]] = field(default_factory=dict, init=False, repr=False)
+  """Called (by channel) when the channel may have missed messages: out of order on the channel, or a gap on the connection (which calls every handler, since it can't tell which channel was affected)."""
+  received: int = field(default=0, init=False, repr=False)
+  """Number of messages received."""
+  decoders: dict[str, pydantic.TypeAdapter[Notification]] = field(default_factory=dict, init=False, repr=False)
+  """Notification frame adapters, by channel (see `frame_adapter`). Notifications of other channels are decoded without validation."""
+
+  def client_for(self, channel: str) -> 'StreamsClient':
+    """The connection `channel` is subscribed on (for a single connection, itself)."""
+    return self
+
+  def check_sequence(self, message_id: int, channel: str | None = None):
+    expected = None if self.last_message_id is None else self.last_message_id + 1
+    self.last_message_id = message_id
+    if expected is not None and message_id != expected:
+      logger.warning(f'Message gap: expected message_id {expected}, got {message_id}')
+      for handler in list(self.gap_handlers.values()):
+        handler()
+    elif channel is not None:
+      last = self.channel_message_ids.get(channel)
+      self.channel_message_ids[channel] = message_id
+      if last is not None and message_id <= last and (handler := self.gap_handlers.get(channel)) is not None:
+        logger.warning(f'Out of order message on {channel}: message_id {message_id} after {last}')
+        handler()
+
+  def connection_closed(self, ctx):
+    fail_replies(self.pending) # type: ignore
+    self.last_message_id = None
+    self.channel_message_ids.clear()
+    super().connection_closed(ctx)
+
+  def complete_header(self, head: dict[str, str]) -> bool:
+    """Whether `head` (see `peek`) has all the fields needed to find the channel's decoder."""
+    if 'type' not in head:
+      return False
+    elif not head['type'].startswith('channel_'):
+      return True
+    # `channel` or `id` may come after `contents` (or be missing): then the message is decoded in full
+    return 'channel' in head and 'id' in head
 
   def parse_msg(self, msg: str | bytes) -> Subscription | None:
-    obj = msg_adapter.validate_json(msg)
+    """Parse a message. Notifications failing validation are delivered to their channel as the `ValidationError` (see `StreamsMixin.subscribe_parsed`)."""
+    self.received += 1
+    obj: Any = None
+    decoder = error = None
+    if self.decoders:
+      head: Any = peek(msg)
+      if not self.complete_header(head):
+        head = obj = orjson.loads(msg)
+      if head['type'].startswith('channel_'):
+        decoder = self.decoders.get(channel_id(head))
+    if decoder is not None:
+      try:
+        obj = decoder.validate_json(msg) if obj is None else decoder.validate_python(obj)
+      except pydantic.ValidationError as e:
+        error = e
+    if obj is None:
+      obj = orjson.loads(msg)
     match obj['type']:
-      case 'subscribed' | 'unsubscribed' | 'error':
-        self.replies.put_nowait(obj)
+      case 'connected':
+        self.check_sequence(obj['message_id'])
+      case 'subscribed' | 'unsubscribed':
+        self.check_sequence(obj['message_id'])
+        self.reply((obj['type'], channel_id(obj)), obj)
+      case 'error':
+        self.check_sequence(obj['message_id'])
+        # errors don't say which request they answer, but replies come in order: it's the oldest pending one
+        self.reply(next(iter(self.pending), None), obj)
       case 'channel_data' | 'channel_batch_data':
         channel = channel_id(obj)
-        return {'channel': channel, 'notification': obj}
+        self.check_sequence(obj['message_id'], channel)
+        return {'channel': channel, 'notification': error or obj}
 
   async def send(self, msg):
     ws = await self.ws
     await ws.send(orjson.dumps(msg), text=True)
 
+  def reply(self, key: tuple[str, str] | None, obj: Error | Subscribed | Unsubscribed):
+    if key is not None and (fut := self.pending.pop(key, None)) is not None and not fut.done():
+      fut.set_result(obj)
+    else:
+      logger.warning(f'Unexpected reply: {obj}')
+
   async def request(self, msg):
-    async with self.lock:
+    """Send a (un)subscription request and wait for its reply. Many requests can be in flight at once."""
+    key = ('subscribed' if msg['type'] == 'subscribe' else 'unsubscribed', channel_id(msg))
+    if key in self.pending:
+      raise LogicError(f'Request already in flight: {key}')
+    self.pending[key] = fut = asyncio.get_running_loop().create_future()
+    try:
       await self.send(msg)
-      return await self.replies.get()
+      return await fut
+    finally:
+      if self.pending.get(key) is fut:
+        del self.pending[key]
+
+  async def subscribe_many(self, channels: Sequence[str], params: Params | None = None) -> list[Stream[Notification, Subscribed, Unsubscribed]]:
+    """Subscribe to many channels at once, with all the requests in flight concurrently. If any subscription fails, the others are undone."""
+    return await subscribe_all(self.subscribe(channel, params) for channel in channels)
 
   async def request_subscription(self, channel: str, params: Params | None = None) -> Subscribed:
     channel, id = parse_channel_id(channel)
@@ -118,12 +245,93 @@ class StreamsClient(Streams[Notification, Params, Subscribed, Unsubscribed]):
 
 @dataclass(kw_only=True)
 class StreamsMixin:
-  client: StreamsClient = field(default_factory=StreamsClient)
+  client: 'StreamsClient | ShardedStreamsClient' = field(default_factory=StreamsClient)
   default_validate: bool = True
 
   def validate(self, validate: bool | None = None) -> bool:
     return self.default_validate if validate is None else validate
 
+  async def subscribe_parsed(
+    self, channel: str, *, batched: bool, validate: bool | None,
+    reply: pydantic.TypeAdapter, notification: Any,
+  ) -> Stream[Any, Any, Unsubscribed]:
+    """Subscribe to `channel`, yielding its notifications one by one (unbatched).
+
+    When validating, notification frames are validated once, as a whole, against `notification` (see `frame_adapter`). A notification failing validation is raised by the stream (the subscription stays open until unsubscribed).
+    """
+    validate = self.validate(validate)
+    decoders = self.client.client_for(channel).decoders
+    decoder = frame_adapter(list[notification] if batched else notification) if validate else None
+    if decoder is not None:
+      decoders[channel] = decoder
+    else:
+      decoders.pop(channel, None)
+    try:
+      stream = await self.client.subscribe(channel, {'batched': batched})
+    except BaseException:
+      if decoder is not None and decoders.get(channel) is decoder:
+        del decoders[channel]
+      raise
+
+    async def parsed_stream() -> AsyncIterable:
+      async for msg in stream:
+        if isinstance(msg, pydantic.ValidationError):
+          raise msg
+        if batched:
+          for d in msg['contents']:
+            yield d
+        else:
+          yield msg['contents']
+
+    async def unsubscribe():
+      decoders.pop(channel, None)
+      return await stream.unsubscribe()
+
+    c = stream.reply['contents']
+    return Stream(reply.validate_python(c) if validate else c, parsed_stream(), unsubscribe)
+
+  async def subscribe_state(
+    self, channel: str, subscribe: Callable[[], Awaitable[Stream[Any, Any, Unsubscribed]]], *,
+    init: Callable[[Any], S], reset: Callable[[S, Any], Any], apply: Callable[[S, Any], Any], resync: bool = True,
+  ) -> Stream[S, S, Unsubscribed]:
+    """Subscribe (with `subscribe`, to `channel`), maintaining a local state: built from the reply with `init`, updated in place by `apply` with each notification.
+
+    The stream's `reply` is the state; each notification yields it again after applying the update.
+
+    If `resync`, the channel is resubscribed when messages may have been missed (see `StreamsClient.gap_handlers`), and the state `reset` from the new reply (and yielded).
+    """
+    stream = await subscribe()
+    state = init(stream.reply)
+    gap = asyncio.Event()
+    gap_handlers = self.client.client_for(channel).gap_handlers
+    if resync:
+      gap_handlers[channel] = gap.set
+
+    async def updates() -> AsyncIterable[S]:
+      nonlocal stream
+      try:
+        while True:
+          async for msg in stream:
+            if gap.is_set():
+              break
+            apply(state, msg)
+            yield state
+          else:
+            return # unsubscribed
+          gap.clear()
+          await stream.unsubscribe()
+          stream = await subscribe()
+          reset(state, stream.reply)
+          yield state
+      finally:
+        if gap_handlers.get(channel) == gap.set:
+          del gap_handlers[channel]
+
+    async def unsubscribe():
+      return await stream.unsubscribe()
+
+    return Stream(state, updates(), unsubscribe)
+
   async def __aenter__(self):
     await self.client.__aenter__()
     return self
@@ -132,5 +340,13 @@ class StreamsMixin:
     await self.client.__aexit__(exc_type, exc_value, traceback)
 
   @classmethod
-  def new(cls, url: str = INDEXER_WS_URL, *, validate: bool = True):
+  def new(cls, url: str = INDEXER_WS_URL, *, validate: bool = True, connections: int = 1):
+    """
+    - `url`: The indexer WebSocket URL.
+    - `validate`: Whether to validate payloads by default.
+    - `connections`: Number of connections to spread subscriptions across (see `ShardedStreamsClient`).
+    """
+    if connections > 1:
+      from .sharded import ShardedStreamsClient
+      return cls(client=ShardedStreamsClient.new(connections, url=url), default_validate=validate)
     return cls(client=StreamsClient(url=url), default_validate=validate)
\ No newline at end of file
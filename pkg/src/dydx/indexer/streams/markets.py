@@ -0,0 +1,114 @@
+from typing_extensions import AsyncIterable, Mapping
+from dataclasses import dataclass, field
+
+from typed_core.util import Stream
+from dydx.core.util import filter_kwargs
+from dydx.indexer.types import PerpetualMarket
+from .core import Unsubscribed
+from .api.markets import Markets as MarketsAPI, Notification
+
+REQUIRED_FIELDS = frozenset([
+  'ticker', 'clobPairId', 'status', 'atomicResolution', 'quantumConversionExponent', 'stepBaseQuantums', 'subticksPerTick',
+  'tickSize', 'stepSize', 'initialMarginFraction', 'maintenanceMarginFraction',
+])
+"""Fields a market added by a stream update must have: those needed to build orders (see `MarketSpec`) and compute margins."""
+
+@dataclass
+class MarketRegistry:
+  """Markets by ticker and by CLOB pair id, kept up to date from the `v4_markets` stream.
+
+  ```python
+  stream = await indexer.streams.markets()
+  markets = MarketRegistry.of(stream.reply['markets'])
+  asyncio.create_task(markets.follow(stream))
+  await node.place_order(markets['BTC-USD'], order)
+  ```
+
+  (Or see `IndexerStreams.market_registry`, which also resyncs after missed messages.)
+
+  Lookups are `O(1)`; updates modify the market dicts in place.
+  """
+  markets: dict[str, PerpetualMarket] = field(default_factory=dict)
+  """Markets by ticker."""
+  by_clob_pair_id: dict[int, PerpetualMarket] = field(default_factory=dict)
+
+  @classmethod
+  def of(cls, markets: Mapping[str, PerpetualMarket]) -> 'MarketRegistry':
+    """Registry of `markets` (e.g. `get_markets()['markets']`, or the `v4_markets` subscription reply's)."""
+    registry = cls()
+    registry.reset(markets)
+    return registry
+
+  def __getitem__(self, ticker: str) -> PerpetualMarket:
+    return self.markets[ticker]
+
+  def __contains__(self, ticker: str) -> bool:
+    return ticker in self.markets
+
+  def __len__(self):
+    return len(self.markets)
+
+  def get(self, ticker: str) -> PerpetualMarket | None:
+    return self.markets.get(ticker)
+
+  def clob_pair(self, clob_pair_id: int) -> PerpetualMarket | None:
+    """The market of a CLOB pair id (e.g. of an `OrderId`)."""
+    return self.by_clob_pair_id.get(int(clob_pair_id))
+
+  def reset(self, markets: Mapping[str, PerpetualMarket]):
+    """Replace all markets, in place: the dicts of markets still listed are updated (so references to them stay live), new ones are added and the others removed."""
+    for ticker in self.markets.keys() - markets.keys():
+      del self.markets[ticker]
+    for ticker, new in markets.items():
+      if (market := self.markets.get(ticker)) is not None:
+        market.clear()
+        market.update(new)
+      else:
+        self.markets[ticker] = dict(new) # type: ignore
+    self.by_clob_pair_id.clear()
+    self.by_clob_pair_id.update((int(m['clobPairId']), m) for m in self.markets.values())
+
+  def apply(self, notification: Notification):
+    """Apply a stream update: `trading` deltas (only the fields they set) and `oraclePrices`.
+
+    Markets not seen before are only added if the update has their `REQUIRED_FIELDS`; partial ones are skipped (and picked up by the next `reset`, e.g. on resync).
+    """
+    for ticker, delta in (notification.get('trading') or {}).items():
+      changes = {k: v for k, v in filter_kwargs(PerpetualMarket, delta).items() if v is not None}
+      if (market := self.markets.get(ticker)) is not None:
+        if 'clobPairId' in changes and changes['clobPairId'] != market['clobPairId']:
+          self.by_clob_pair_id.pop(int(market['clobPairId']), None)
+          self.by_clob_pair_id[int(changes['clobPairId'])] = market
+        market.update(changes) # type: ignore
+      elif REQUIRED_FIELDS <= {'ticker', *changes}:
+        market = self.markets[ticker] = {'ticker': ticker, **changes} # type: ignore
+        self.by_clob_pair_id[int(changes['clobPairId'])] = market # type: ignore
+    for ticker, price in (notification.get('oraclePrices') or {}).items():
+      if (market := self.markets.get(ticker)) is not None:
+        market['oraclePrice'] = price['oraclePrice']
+
+  async def follow(self, stream: AsyncIterable[Notification]):
+    """Apply the updates of a `v4_markets` stream (`IndexerStreams.markets()`) until it ends."""
+    async for msg in stream:
+      self.apply(msg)
+
+@dataclass
+class Markets(MarketsAPI):
+  async def market_registry(
+    self, *, batched: bool = True, validate: bool | None = None, resync: bool = True,
+  ) -> Stream[MarketRegistry, MarketRegistry, Unsubscribed]:
+    """Subscribe to the markets feed, maintaining a `MarketRegistry`.
+
+    The stream's `reply` is the registry, loaded from the subscription's snapshot and updated in place; each notification yields it again after applying the update (so the stream must be iterated for the registry to stay up to date).
+
+    Set it as `IndexerData.market_registry` for `get_market` to read markets from it; or pass its markets to the node's order methods directly.
+
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    - `resync`: Whether to resubscribe (and reload the registry from the new snapshot) when messages may have been missed.
+    """
+    return await self.subscribe_state(
+      'v4_markets', lambda: self.markets(batched=batched, validate=validate),
+      init=lambda reply: MarketRegistry.of(reply['markets']), reset=lambda registry, reply: registry.reset(reply['markets']),
+      apply=MarketRegistry.apply, resync=resync,
+    )
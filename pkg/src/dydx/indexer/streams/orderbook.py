@@ -0,0 +1,157 @@
+from typing_extensions import Iterable, Literal, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from bisect import bisect_left
+
+from typed_core.util import Stream
+from .core import Unsubscribed
+from .api.orders import Orders, Notification, Reply, NotificationEntry
+
+Side = Literal['bids', 'asks']
+
+@dataclass
+class BookSide:
+  """One side of the book: sizes keyed by integer price (in ticks).
+
+  Keys are kept sorted in `keys` as `sign * ticks`, so that the best level is always the last one: updates near the top of the book only move a few elements.
+  """
+  sign: Literal[1, -1]
+  keys: list[int] = field(default_factory=list)
+  sizes: dict[int, Decimal] = field(default_factory=dict)
+
+  def __len__(self):
+    return len(self.keys)
+
+  def update(self, ticks: int, size: Decimal):
+    key = self.sign * ticks
+    if not size:
+      if self.sizes.pop(key, None) is not None:
+        del self.keys[bisect_left(self.keys, key)]
+    else:
+      if key not in self.sizes:
+        self.keys.insert(bisect_left(self.keys, key), key)
+      self.sizes[key] = size
+
+  def clear(self):
+    self.keys.clear()
+    self.sizes.clear()
+
+  def best(self) -> tuple[int, Decimal] | None:
+    if self.keys:
+      key = self.keys[-1]
+      return self.sign * key, self.sizes[key]
+
+  def levels(self) -> Iterable[tuple[int, Decimal]]:
+    """Levels from best to worst, as `(ticks, size)`."""
+    for key in reversed(self.keys):
+      yield self.sign * key, self.sizes[key]
+
+@dataclass
+class OrderBook:
+  """Local order book, maintained from the `v4_orderbook` stream.
+
+  ```python
+  stream = await indexer.streams.order_book('BTC-USD', tick_size=market['tickSize'])
+  async for book in stream:
+    print(book.best_bid(), book.best_ask())
+  ```
+
+  - Updates are `O(log n)` (plus a short move near the top of the book).
+  - `best_bid`/`best_ask` are `O(1)`.
+  """
+  tick_size: Decimal
+  bids: BookSide = field(default_factory=lambda: BookSide(1))
+  asks: BookSide = field(default_factory=lambda: BookSide(-1))
+
+  @classmethod
+  def of(cls, reply: Reply, *, tick_size: Decimal) -> 'OrderBook':
+    book = cls(tick_size=Decimal(tick_size))
+    book.reset(reply)
+    return book
+
+  def ticks(self, price) -> int:
+    return int(Decimal(price) / self.tick_size)
+
+  def price(self, ticks: int) -> Decimal:
+    return ticks * self.tick_size
+
+  def reset(self, snapshot: Reply):
+    """Replace the whole book with a snapshot (subscription reply, or `get_order_book` response)."""
+    self.bids.clear()
+    self.asks.clear()
+    for e in snapshot['bids']:
+      self.bids.update(self.ticks(e['price']), Decimal(e['size']))
+    for e in snapshot['asks']:
+      self.asks.update(self.ticks(e['price']), Decimal(e['size']))
+
+  def apply(self, notification: Notification):
+    """Apply a stream update: each `(price, size)` entry sets the level's size (`0` removes it)."""
+    for price, size in notification.get('bids') or []:
+      self.bids.update(self.ticks(price), Decimal(size))
+    for price, size in notification.get('asks') or []:
+      self.asks.update(self.ticks(price), Decimal(size))
+
+  def side(self, side: Side) -> BookSide:
+    return self.bids if side == 'bids' else self.asks
+
+  def best(self, side: Side) -> NotificationEntry | None:
+    if (level := self.side(side).best()) is not None:
+      ticks, size = level
+      return NotificationEntry(self.price(ticks), size)
+
+  def best_bid(self) -> NotificationEntry | None:
+    return self.best('bids')
+
+  def best_ask(self) -> NotificationEntry | None:
+    return self.best('asks')
+
+  def mid(self) -> Decimal | None:
+    if (bid := self.bids.best()) is not None and (ask := self.asks.best()) is not None:
+      return self.price(bid[0] + ask[0]) / 2
+
+  def top(self, side: Side, n: int) -> Sequence[NotificationEntry]:
+    """The best `n` levels of a side, best first."""
+    out: list[NotificationEntry] = []
+    for ticks, size in self.side(side).levels():
+      if len(out) >= n:
+        break
+      out.append(NotificationEntry(self.price(ticks), size))
+    return out
+
+  def depth_to_size(self, side: Side, size: Decimal) -> tuple[Decimal, Decimal] | None:
+    """Walk `side` from the top until `size` is covered.
+
+    Returns `(worst_price, average_price)`, or `None` if the side doesn't have enough size. `size` must be positive.
+    """
+    size = remaining = Decimal(size)
+    if size <= 0:
+      raise ValueError(f'size must be positive, got {size}')
+    notional = Decimal(0)
+    for ticks, level_size in self.side(side).levels():
+      filled = min(remaining, level_size)
+      notional += filled * ticks
+      remaining -= filled
+      if not remaining:
+        return self.price(ticks), self.price(notional) / size
+
+@dataclass
+class OrderBooks(Orders):
+  async def order_book(
+    self, market: str, *, tick_size: Decimal, batched: bool = True, validate: bool | None = None,
+    resync: bool = True,
+  ) -> Stream[OrderBook, OrderBook, Unsubscribed]:
+    """Subscribe to the order book feed of a market, maintaining a local `OrderBook`.
+
+    The stream's `reply` is the book, which is updated in place; each notification yields it again after applying the update.
+
+    - `market`: Market ticker.
+    - `tick_size`: The market's tick size (e.g. `PerpetualMarket['tickSize']`).
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    - `resync`: Whether to resubscribe (and reset the book from the new snapshot) when messages may have been missed.
+    """
+    return await self.subscribe_state(
+      f'v4_orderbook:{market}', lambda: self.orders(id=market, batched=batched, validate=validate),
+      init=lambda reply: OrderBook.of(reply, tick_size=tick_size), reset=OrderBook.reset, apply=OrderBook.apply,
+      resync=resync,
+    )
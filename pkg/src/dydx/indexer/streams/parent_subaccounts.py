@@ -1,6 +1,152 @@
-from dataclasses import dataclass
+from typing_extensions import Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
 
-from .api.parent_subaccounts import ParentSubaccounts as ParentSubaccountsAPI
+from typed_core.util import Stream
+from dydx.indexer.types import PerpetualMarket
+from .core import Unsubscribed
+from .subaccounts import SubaccountState
+from .api.parent_subaccounts import (
+  ParentSubaccounts as ParentSubaccountsAPI, Notification, Reply, Order,
+  PerpetualPositionSubaccountMessage, AssetPositionSubaccountMessage, OrderSubaccountMessage,
+)
+
+QUOTE_SYMBOL = 'USDC'
+
+def signed_size(entry: Mapping | None) -> Decimal:
+  """Size of a position or asset balance, negative if `SHORT`."""
+  if entry is None:
+    return Decimal(0)
+  size = abs(Decimal(entry['size']))
+  return -size if entry['side'] == 'SHORT' else size
+
+@dataclass
+class ParentSubaccountState:
+  """Local state of a parent subaccount and its children, maintained from the `v4_parent_subaccounts` stream.
+
+  ```python
+  stream = await indexer.streams.parent_subaccount_state(address, subaccount=0)
+  async for state in stream:
+    print(state.equity(markets), state.free_collateral(markets))
+  ```
+
+  Each child is a `SubaccountState`. Updates go to the child they're tagged with, and adjust the parent's aggregates by the change, so their cost doesn't grow with the number of children:
+
+  - `quote_balance`: total USDC balance
+  - `net_sizes`: total signed position size, by market
+  - `gross_sizes`: total absolute position size, by market (margin requirements don't net across children)
+  """
+  address: str
+  parent_subaccount_number: int
+  block_height: int = 0
+  children: dict[int, SubaccountState] = field(default_factory=dict)
+  quote_balance: Decimal = Decimal(0)
+  net_sizes: dict[str, Decimal] = field(default_factory=dict)
+  gross_sizes: dict[str, Decimal] = field(default_factory=dict)
+  order_children: dict[str, int] = field(default_factory=dict, repr=False)
+  """Child subaccount number, by order id."""
+
+  @classmethod
+  def of(cls, reply: Reply) -> 'ParentSubaccountState':
+    sub = reply['subaccount']
+    state = cls(sub['address'], int(sub['parentSubaccountNumber']))
+    state.reset(reply)
+    return state
+
+  def reset(self, reply: Reply):
+    """Replace the whole state with a snapshot (subscription reply)."""
+    self.block_height = int(reply['blockHeight'])
+    self.children = {}
+    self.quote_balance = Decimal(0)
+    self.net_sizes = {}
+    self.gross_sizes = {}
+    self.order_children = {}
+    orders: dict[int, list[Order]] = {}
+    for order in reply['orders']:
+      orders.setdefault(int(order['subaccountNumber']), []).append(order)
+    for sub in reply['subaccount']['childSubaccounts']:
+      number = int(sub['subaccountNumber'])
+      child = self.children[number] = SubaccountState(self.address, number)
+      child.reset(sub, orders.pop(number, []), block_height=self.block_height) # type: ignore
+      for position in child.positions.values():
+        self.adjust_position(position['market'], None, position)
+      self.quote_balance += signed_size(child.asset_positions.get(QUOTE_SYMBOL))
+      self.order_children.update((id, number) for id in child.orders)
+    for number, rest in orders.items():
+      for order in rest:
+        self.update_order(order) # type: ignore
+
+  def child(self, number: int) -> SubaccountState:
+    if (child := self.children.get(number)) is None:
+      child = self.children[number] = SubaccountState(self.address, number, block_height=self.block_height)
+    return child
+
+  def adjust_position(self, market: str, old: Mapping | None, new: Mapping | None):
+    old_size, new_size = signed_size(old), signed_size(new)
+    if old_size != new_size:
+      self.net_sizes[market] = self.net_sizes.get(market, Decimal(0)) - old_size + new_size
+      self.gross_sizes[market] = self.gross_sizes.get(market, Decimal(0)) - abs(old_size) + abs(new_size)
+      if not self.gross_sizes[market]:
+        del self.net_sizes[market], self.gross_sizes[market]
+
+  def update_position(self, position: PerpetualPositionSubaccountMessage):
+    child = self.child(int(position['subaccountNumber']))
+    market = position['market']
+    old = child.positions.get(market)
+    child.update_position(position) # type: ignore
+    self.adjust_position(market, old, child.positions.get(market))
+
+  def update_asset(self, asset: AssetPositionSubaccountMessage):
+    child = self.child(int(asset['subaccountNumber']))
+    if asset['symbol'] != QUOTE_SYMBOL:
+      child.update_asset(asset) # type: ignore
+      return
+    old = signed_size(child.asset_positions.get(QUOTE_SYMBOL))
+    child.update_asset(asset) # type: ignore
+    self.quote_balance += signed_size(child.asset_positions.get(QUOTE_SYMBOL)) - old
+
+  def update_order(self, order: OrderSubaccountMessage):
+    """Update an order of the child it's tagged with (or else, the child it was seen on before)."""
+    number = order.get('subaccountNumber')
+    if number is None and (number := self.order_children.get(order['id'])) is None:
+      return
+    child = self.child(int(number))
+    child.update_order(order) # type: ignore
+    if order['id'] in child.orders:
+      self.order_children[order['id']] = child.subaccount_number
+    else:
+      self.order_children.pop(order['id'], None)
+
+  def apply(self, notification: Notification):
+    """Apply a stream update to the children it concerns, and to the aggregates."""
+    for position in notification.get('perpetualPositions') or []:
+      self.update_position(position)
+    for asset in notification.get('assetPositions') or []:
+      self.update_asset(asset)
+    for order in notification.get('orders') or []:
+      self.update_order(order)
+    if (height := notification.get('blockHeight')) is not None:
+      self.block_height = max(self.block_height, int(height))
+
+  def equity(self, markets: Mapping[str, PerpetualMarket]) -> Decimal:
+    """Total equity of the children: USDC balance plus positions at the markets' `oraclePrice`.
+
+    - `markets`: markets by ticker (e.g. `MarketRegistry.markets`)
+    """
+    return self.quote_balance + sum(
+      (size * Decimal(markets[m]['oraclePrice']) for m, size in self.net_sizes.items()), Decimal(0)
+    )
+
+  def initial_margin(self, markets: Mapping[str, PerpetualMarket]) -> Decimal:
+    """Total initial margin requirement of the children's positions (at the markets' `oraclePrice` and `initialMarginFraction`)."""
+    return sum((
+      size * Decimal(markets[m]['oraclePrice']) * Decimal(markets[m]['initialMarginFraction'])
+      for m, size in self.gross_sizes.items()
+    ), Decimal(0))
+
+  def free_collateral(self, markets: Mapping[str, PerpetualMarket]) -> Decimal:
+    """Total free collateral of the children: `equity - initial_margin`."""
+    return self.equity(markets) - self.initial_margin(markets)
 
 @dataclass
 class ParentSubaccounts(ParentSubaccountsAPI):
@@ -25,3 +171,24 @@ class ParentSubaccounts(ParentSubaccountsAPI):
       batched=batched,
       validate=validate,
     )
+
+  async def parent_subaccount_state(
+    self, address: str, *, subaccount: int, batched: bool = True, validate: bool | None = None,
+    resync: bool = True,
+  ) -> Stream[ParentSubaccountState, ParentSubaccountState, Unsubscribed]:
+    """Subscribe to a parent subaccount's updates, maintaining a `ParentSubaccountState`.
+
+    The stream's `reply` is the state, which is updated in place; each notification yields it again after applying the update.
+
+    - `address`: Wallet address that owns the parent subaccount.
+    - `subaccount`: Parent subaccount number.
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    - `resync`: Whether to resubscribe (and reset the state from the new snapshot) when messages may have been missed.
+    """
+    id = f'{address}/{subaccount}'
+    return await self.subscribe_state(
+      f'v4_parent_subaccounts:{id}', lambda: self.raw_parent_subaccounts(id=id, batched=batched, validate=validate),
+      init=ParentSubaccountState.of, reset=ParentSubaccountState.reset, apply=ParentSubaccountState.apply,
+      resync=resync,
+    )
@@ -0,0 +1,86 @@
+from typing_extensions import Sequence
+from dataclasses import dataclass, field
+import asyncio
+import hashlib
+
+from typed_core.util import Stream
+from .core import StreamsClient, Params, Notification, Subscribed, Unsubscribed, INDEXER_WS_URL, subscribe_all
+
+@dataclass
+class ShardStats:
+  shard: int
+  channels: list[str]
+  """Channels subscribed on this connection."""
+  received: int
+  """Messages received on this connection."""
+  backlog: int
+  """Notifications received but not consumed yet."""
+
+@dataclass
+class ShardedStreamsClient:
+  """Spreads subscriptions across several `StreamsClient` connections, so that a busy channel (or a slow consumer) doesn't delay the others.
+
+  Channels go to the shard they're pinned to, or else to one picked by a (stable) hash of the channel id.
+
+  ```python
+  client = ShardedStreamsClient.new(4, pins={'v4_orderbook:BTC-USD': 0})
+  streams = IndexerStreams(client=client)
+  ```
+  """
+  shards: list[StreamsClient]
+  pins: dict[str, int] = field(default_factory=dict)
+  """Shard index by channel id (e.g. `'v4_orderbook:BTC-USD'`)."""
+
+  def __post_init__(self):
+    if not self.shards:
+      raise ValueError('At least one shard is required')
+    for channel, shard in self.pins.items():
+      self.check_shard(channel, shard)
+
+  def check_shard(self, channel: str, shard: int):
+    if not 0 <= shard < len(self.shards):
+      raise ValueError(f'Invalid shard {shard} for {channel}: there are {len(self.shards)} shards')
+
+  @classmethod
+  def new(cls, connections: int, *, url: str = INDEXER_WS_URL, pins: dict[str, int] | None = None):
+    return cls(shards=[StreamsClient(url=url) for _ in range(connections)], pins=pins or {})
+
+  async def __aenter__(self):
+    await asyncio.gather(*(shard.__aenter__() for shard in self.shards))
+    return self
+
+  async def __aexit__(self, exc_type, exc_value, traceback):
+    await asyncio.gather(*(shard.__aexit__(exc_type, exc_value, traceback) for shard in self.shards))
+
+  def shard_index(self, channel: str) -> int:
+    if (index := self.pins.get(channel)) is not None:
+      return index
+    digest = hashlib.blake2b(channel.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % len(self.shards)
+
+  def client_for(self, channel: str) -> StreamsClient:
+    """The connection `channel` is (or would be) subscribed on."""
+    return self.shards[self.shard_index(channel)]
+
+  def pin(self, channel: str, shard: int):
+    """Pin `channel` to a shard. Only affects subscriptions made afterwards."""
+    self.check_shard(channel, shard)
+    self.pins[channel] = shard
+
+  def subscribe(self, channel: str, params: Params | None = None, **kwargs):
+    return self.client_for(channel).subscribe(channel, params, **kwargs)
+
+  async def subscribe_many(self, channels: Sequence[str], params: Params | None = None) -> list[Stream[Notification, Subscribed, Unsubscribed]]:
+    """Subscribe to many channels at once, with all the requests in flight concurrently. If any subscription fails, the others are undone."""
+    return await subscribe_all(self.subscribe(channel, params) for channel in channels)
+
+  def stats(self) -> list[ShardStats]:
+    return [
+      ShardStats(
+        shard=i,
+        channels=list(shard.subscriptions),
+        received=shard.received,
+        backlog=sum(q.qsize() for q in shard.subscriptions.values()),
+      )
+      for i, shard in enumerate(self.shards)
+    ]
@@ -1,6 +1,129 @@
-from dataclasses import dataclass
+from typing_extensions import Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
 
-from .api.subaccounts import Subaccounts as SubaccountsAPI, Notification
+from typed_core.util import Stream
+from .core import Unsubscribed
+from .api.subaccounts import (
+  Subaccounts as SubaccountsAPI, Notification, Reply, Subaccount, Order,
+  PerpetualPosition, AssetPosition, PerpetualPositionSubaccountMessage,
+  AssetPositionSubaccountMessage, OrderSubaccountMessage,
+)
+
+FINAL_ORDER_STATUSES = frozenset(['FILLED', 'CANCELED', 'BEST_EFFORT_CANCELED'])
+"""Statuses of orders that are no longer open (removed from `SubaccountState.orders`)."""
+
+def merge(old, new):
+  """`old` updated with the fields set in `new`, as a new dict."""
+  if old is None:
+    return {k: v for k, v in new.items() if v is not None}
+  return {**old, **{k: v for k, v in new.items() if v is not None}}
+
+@dataclass(frozen=True)
+class SubaccountSnapshot:
+  """Point-in-time copy of a `SubaccountState` (unaffected by later updates)."""
+  address: str
+  subaccount_number: int
+  block_height: int
+  equity: Decimal
+  free_collateral: Decimal
+  positions: Mapping[str, PerpetualPosition]
+  asset_positions: Mapping[str, AssetPosition]
+  orders: Mapping[str, Order]
+
+@dataclass
+class SubaccountState:
+  """Local state of a subaccount, maintained from the `v4_subaccounts` stream.
+
+  ```python
+  stream = await indexer.streams.subaccount_state(address, subaccount=0)
+  async for state in stream:
+    print(state.block_height, state.positions.keys(), len(state.orders))
+  ```
+
+  - `positions`: open perpetual positions, by market
+  - `asset_positions`: asset balances, by symbol
+  - `orders`: open orders, by id (see `client_order` to look them up by client id)
+
+  Updates replace the changed entries (they never modify them in place), so `snapshot` is a cheap shallow copy.
+
+  The indexer doesn't stream `equity` and `free_collateral`: they're those of the latest snapshot.
+  """
+  address: str
+  subaccount_number: int
+  block_height: int = 0
+  equity: Decimal = Decimal(0)
+  free_collateral: Decimal = Decimal(0)
+  positions: dict[str, PerpetualPosition] = field(default_factory=dict)
+  asset_positions: dict[str, AssetPosition] = field(default_factory=dict)
+  orders: dict[str, Order] = field(default_factory=dict)
+  client_ids: dict[str, str] = field(default_factory=dict, repr=False)
+  """Order ids, by client id."""
+
+  @classmethod
+  def of(cls, reply: Reply) -> 'SubaccountState':
+    """State from a subscription reply (or equivalent `get_subaccount` and `list_orders` responses)."""
+    sub = reply['subaccount']
+    state = cls(sub['address'], int(sub['subaccountNumber']))
+    state.reset(sub, reply['orders'], block_height=reply['blockHeight'])
+    return state
+
+  def reset(self, subaccount: Subaccount, orders: list[Order], *, block_height: int | str):
+    """Replace the whole state with a snapshot."""
+    self.block_height = int(block_height)
+    self.equity = Decimal(subaccount['equity'])
+    self.free_collateral = Decimal(subaccount['freeCollateral'])
+    self.positions = dict(subaccount['openPerpetualPositions'])
+    self.asset_positions = {a['symbol']: a for a in subaccount['assetPositions'].values() if Decimal(a['size'])}
+    self.orders = {}
+    self.client_ids = {}
+    for order in orders:
+      self.update_order(order) # type: ignore
+
+  def update_position(self, position: PerpetualPositionSubaccountMessage):
+    if position['status'] == 'OPEN':
+      self.positions[position['market']] = merge(self.positions.get(position['market']), position)
+    else:
+      self.positions.pop(position['market'], None)
+
+  def update_asset(self, asset: AssetPositionSubaccountMessage):
+    if Decimal(asset['size']):
+      self.asset_positions[asset['symbol']] = merge(self.asset_positions.get(asset['symbol']), asset)
+    else:
+      self.asset_positions.pop(asset['symbol'], None)
+
+  def update_order(self, order: OrderSubaccountMessage):
+    """Update an order (updates only carry some of its fields). Orders with a final status are removed."""
+    id = order['id']
+    if order['status'] in FINAL_ORDER_STATUSES:
+      if (old := self.orders.pop(id, None)) is not None and self.client_ids.get(old['clientId']) == id:
+        del self.client_ids[old['clientId']]
+    else:
+      self.orders[id] = merge(self.orders.get(id), order)
+      self.client_ids[order['clientId']] = id
+
+  def apply(self, notification: Notification):
+    """Apply a stream update: positions, asset balances, orders and block height (fills and transfers don't change the state by themselves)."""
+    for position in notification.get('perpetualPositions') or []:
+      self.update_position(position)
+    for asset in notification.get('assetPositions') or []:
+      self.update_asset(asset)
+    for order in notification.get('orders') or []:
+      self.update_order(order)
+    if (height := notification.get('blockHeight')) is not None:
+      self.block_height = max(self.block_height, int(height))
+
+  def client_order(self, client_id: int | str) -> Order | None:
+    """The open order with `client_id` (the latest one, if several markets share it)."""
+    if (id := self.client_ids.get(str(client_id))) is not None:
+      return self.orders.get(id)
+
+  def snapshot(self) -> SubaccountSnapshot:
+    return SubaccountSnapshot(
+      address=self.address, subaccount_number=self.subaccount_number, block_height=self.block_height,
+      equity=self.equity, free_collateral=self.free_collateral,
+      positions=dict(self.positions), asset_positions=dict(self.asset_positions), orders=dict(self.orders),
+    )
 
 @dataclass
 class Subaccounts(SubaccountsAPI):
@@ -16,3 +139,24 @@ class Subaccounts(SubaccountsAPI):
       batched=batched,
       validate=validate,
     )
+
+  async def subaccount_state(
+    self, address: str, *, subaccount: int, batched: bool = True, validate: bool | None = None,
+    resync: bool = True,
+  ) -> Stream[SubaccountState, SubaccountState, Unsubscribed]:
+    """Subscribe to a subaccount's updates, maintaining a `SubaccountState`.
+
+    The stream's `reply` is the state, which is updated in place; each notification yields it again after applying the update.
+
+    - `address`: Wallet address that owns the subaccount.
+    - `subaccount`: Subaccount number.
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    - `resync`: Whether to resubscribe (and reset the state from the new snapshot) when messages may have been missed.
+    """
+    id = f'{address}/{subaccount}'
+    return await self.subscribe_state(
+      f'v4_subaccounts:{id}', lambda: self.raw_subaccounts(id=id, batched=batched, validate=validate),
+      init=SubaccountState.of, apply=SubaccountState.apply, resync=resync,
+      reset=lambda state, reply: state.reset(reply['subaccount'], reply['orders'], block_height=reply['blockHeight']),
+    )
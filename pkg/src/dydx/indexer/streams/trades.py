@@ -0,0 +1,172 @@
+from typing_extensions import TYPE_CHECKING, AsyncIterable, NamedTuple, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from typed_core.util import Stream
+from dydx.core import numpy, nanos
+from .core import Unsubscribed
+from .api.trades import Trades as TradesAPI, Trade, TradeUpdate
+
+if TYPE_CHECKING:
+  import numpy as np
+
+class WindowStats(NamedTuple):
+  trades: int
+  volume: float
+  """Base volume."""
+  notional: float
+  """Quote (USD) volume."""
+  buy_volume: float
+  sell_volume: float
+
+  @property
+  def vwap(self) -> float | None:
+    return self.notional / self.volume if self.volume else None
+
+  @property
+  def imbalance(self) -> float | None:
+    """`(buy - sell) / (buy + sell)` volume, in `[-1, 1]`."""
+    return (self.buy_volume - self.sell_volume) / self.volume if self.volume else None
+
+@dataclass
+class Window:
+  """Running sums over the trades of the last `duration` nanoseconds, from `tail` (sequence number of the oldest trade in the window)."""
+  duration: int
+  tail: int = 0
+  trades: int = 0
+  volume: float = 0
+  notional: float = 0
+  buy_volume: float = 0
+
+  def stats(self) -> WindowStats:
+    return WindowStats(self.trades, self.volume, self.notional, self.buy_volume, self.volume - self.buy_volume)
+
+@dataclass
+class TradeTape:
+  """The latest `capacity` trades of a market, in preallocated NumPy arrays (`pip install typed-dydx[numpy]`), with rolling aggregates over time `windows`.
+
+  ```python
+  stream = await indexer.streams.trade_tape('BTC-USD', windows=[timedelta(minutes=1)])
+  async for tape in stream:
+    stats = tape.stats(timedelta(minutes=1))
+    print(stats.vwap, stats.volume, stats.imbalance)
+  ```
+
+  Timestamps are `int64` nanoseconds since the epoch, prices and sizes `float64`, sides `int8` (`1` for `BUY`, `-1` for `SELL`), as with the columnar results.
+
+  Memory is fixed: each trade overwrites the oldest one once full. Aggregates are updated as trades come in and out of each window (amortized `O(1)` per trade); trades overwritten while still within a window leave it early.
+  """
+  capacity: int = 100_000
+  windows: Sequence[timedelta] = (timedelta(minutes=1),)
+  time: 'np.ndarray' = field(init=False, repr=False)
+  price: 'np.ndarray' = field(init=False, repr=False)
+  size: 'np.ndarray' = field(init=False, repr=False)
+  side: 'np.ndarray' = field(init=False, repr=False)
+  count: int = field(default=0, init=False)
+  """Number of trades ever added (the sequence number of the next one)."""
+  sums: dict[timedelta, Window] = field(init=False, repr=False)
+
+  def __post_init__(self):
+    if self.capacity < 1:
+      raise ValueError(f'capacity must be at least 1, got {self.capacity}')
+    np = numpy()
+    self.time = np.zeros(self.capacity, dtype=np.int64)
+    self.price = np.zeros(self.capacity, dtype=np.float64)
+    self.size = np.zeros(self.capacity, dtype=np.float64)
+    self.side = np.zeros(self.capacity, dtype=np.int8)
+    self.sums = {w: Window(w // timedelta(microseconds=1) * 1000) for w in self.windows}
+
+  def __len__(self) -> int:
+    return min(self.count, self.capacity)
+
+  def remove(self, window: Window):
+    """Remove the window's oldest trade."""
+    i = window.tail % self.capacity
+    size = float(self.size[i])
+    window.tail += 1
+    window.trades -= 1
+    if window.trades == 0:
+      # start over from exact zeros, rather than accumulating rounding errors
+      window.volume = window.notional = window.buy_volume = 0
+      return
+    window.volume -= size
+    window.notional -= size * float(self.price[i])
+    if self.side[i] > 0:
+      window.buy_volume -= size
+
+  def advance(self, now: int):
+    """Remove the trades older than each window, as of `now` (nanoseconds since the epoch)."""
+    for window in self.sums.values():
+      start = now - window.duration
+      while window.trades and self.time[window.tail % self.capacity] <= start:
+        self.remove(window)
+
+  def append(self, time: int, price: float, size: float, side: int):
+    """Add a trade (`time` in nanoseconds since the epoch, `side` `1` for buys and `-1` for sells)."""
+    seq = self.count
+    if seq >= self.capacity:
+      for window in self.sums.values():
+        if window.trades and window.tail == seq - self.capacity:
+          self.remove(window)
+    i = seq % self.capacity
+    self.time[i] = time
+    self.price[i] = price
+    self.size[i] = size
+    self.side[i] = side
+    self.count += 1
+    for window in self.sums.values():
+      if not window.trades:
+        window.tail = seq
+      window.trades += 1
+      window.volume += size
+      window.notional += size * price
+      if side > 0:
+        window.buy_volume += size
+    self.advance(time)
+
+  def add_trades(self, trades: Sequence[Trade | TradeUpdate]):
+    """Add trades (e.g. a stream update, which lists the newest first), oldest first."""
+    for time, t in sorted(((nanos(t['createdAt']), t) for t in trades), key=lambda x: x[0]):
+      self.append(time, float(t['price']), float(t['size']), 1 if t['side'] == 'BUY' else -1)
+
+  def stats(self, window: timedelta, *, now: datetime | None = None) -> WindowStats:
+    """Aggregates over the trades of the last `window` (one of `windows`), as of the latest trade (or `now`, if later)."""
+    if (sums := self.sums.get(window)) is None:
+      raise ValueError(f'Unknown window {window}: the tape aggregates over {list(self.sums)}')
+    if now is not None:
+      self.advance(nanos(now))
+    return sums.stats()
+
+  def last(self, n: int | None = None) -> tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """Copies of the latest `n` (default: all stored) trades' `(time, price, size, side)`, oldest first."""
+    np = numpy()
+    n = len(self) if n is None else min(n, len(self))
+    idx = np.arange(self.count - n, self.count) % self.capacity
+    return self.time[idx], self.price[idx], self.size[idx], self.side[idx]
+
+@dataclass
+class Trades(TradesAPI):
+  async def trade_tape(
+    self, market: str, *, capacity: int = 100_000, windows: Sequence[timedelta] = (timedelta(minutes=1),),
+    batched: bool = True, validate: bool | None = None,
+  ) -> Stream[TradeTape, TradeTape, Unsubscribed]:
+    """Subscribe to a market's trades, recording them on a `TradeTape`.
+
+    The stream's `reply` is the tape (starting with the subscription's recent trades), which is updated in place; each notification yields it again after adding the new trades.
+
+    - `market`: Market ticker.
+    - `capacity`: Max. number of trades to keep.
+    - `windows`: Time windows to aggregate over (see `TradeTape.stats`).
+    - `batched`: Reduce incoming messages by batching contents.
+    - `validate`: Whether to validate reply and update payloads against the generated schemas.
+    """
+    tape = TradeTape(capacity, windows)
+    stream = await self.trades(id=market, batched=batched, validate=validate)
+    tape.add_trades(stream.reply['trades'])
+
+    async def updates() -> AsyncIterable[TradeTape]:
+      async for msg in stream:
+        tape.add_trades(msg['trades'])
+        yield tape
+
+    return Stream(tape, updates(), stream.unsubscribe)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 import asyncio
-from .indexer import Indexer, INDEXER_HTTP_URL, INDEXER_WS_URL, INDEXER_TESTNET_HTTP_URL, INDEXER_TESTNET_WS_URL
+from .indexer import Indexer, Validate, INDEXER_HTTP_URL, INDEXER_WS_URL, INDEXER_TESTNET_HTTP_URL, INDEXER_TESTNET_WS_URL
 from .node import Node, OEGS_GRPC_URL, TESTNET_GRPC_URL
 
 @dataclass
@@ -13,7 +13,7 @@ class DYDX:
     cls, mnemonic: str | None = None, *, node_url: str = OEGS_GRPC_URL,
     rest_indexer: str = INDEXER_HTTP_URL,
     websocket_indexer: str = INDEXER_WS_URL,
-    validate: bool = True,
+    validate: Validate = True,
   ):
     indexer = Indexer.new(http_url=rest_indexer, ws_url=websocket_indexer, validate=validate)
     node = Node.new(mnemonic=mnemonic, url=node_url, rest_indexer=rest_indexer, websocket_indexer=websocket_indexer)
@@ -24,7 +24,7 @@ class DYDX:
     cls, mnemonic: str | None = None, *, node_url: str = TESTNET_GRPC_URL,
     rest_indexer: str = INDEXER_TESTNET_HTTP_URL,
     websocket_indexer: str = INDEXER_TESTNET_WS_URL,
-    validate: bool = True,
+    validate: Validate = True,
   ):
     """Create a new client for the dYdX testnet. [Testnet Frontend](https://v4.testnet.dydx.exchange/)"""
     indexer = Indexer.testnet(http_url=rest_indexer, ws_url=websocket_indexer, validate=validate)
@@ -0,0 +1,64 @@
+from typing_extensions import Awaitable, Callable, Generic, Hashable, NamedTuple, TypeVar
+from dataclasses import dataclass, field
+import asyncio
+import time
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+class CacheStats(NamedTuple):
+  hits: int
+  misses: int
+  size: int
+
+@dataclass
+class TTLCache(Generic[K, V]):
+  """In-memory cache whose entries expire `ttl` seconds after being fetched.
+
+  Concurrent misses of the same key share a single fetch. Failed fetches aren't cached.
+
+  ```python
+  clob_pair = await cache.get(('clob_pair', 0), lambda: fetch_clob_pair(0))
+  ```
+  """
+  ttl: float = 60
+  """Seconds before an entry is fetched again (`0` disables caching)."""
+  entries: dict[K, tuple[float, V]] = field(default_factory=dict, init=False, repr=False)
+  """`key -> (expiry as time.monotonic(), value)`"""
+  fetching: dict[K, asyncio.Future[V]] = field(default_factory=dict, init=False, repr=False)
+  hits: int = field(default=0, init=False)
+  """Calls answered without a fetch of their own (from the cache, or by joining a concurrent fetch)."""
+  misses: int = field(default=0, init=False)
+  """Calls that fetched."""
+
+  async def get(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+    """The cached value of `key`, or else the result of `fetch()` (which is then cached)."""
+    if (entry := self.entries.get(key)) is not None and entry[0] > time.monotonic():
+      self.hits += 1
+      return entry[1]
+    if (fut := self.fetching.get(key)) is not None:
+      self.hits += 1
+    else:
+      self.misses += 1
+      fut = self.fetching[key] = asyncio.ensure_future(fetch())
+      fut.add_done_callback(lambda fut: self.settle(key, fut))
+    return await asyncio.shield(fut)
+
+  def settle(self, key: K, fut: asyncio.Future[V]):
+    ok = not fut.cancelled() and fut.exception() is None
+    if self.fetching.get(key) is fut:
+      del self.fetching[key]
+      if ok and self.ttl > 0:
+        self.entries[key] = (time.monotonic() + self.ttl, fut.result())
+
+  def invalidate(self, key: K | None = None):
+    """Drop `key` (or every entry, if not given), so that it's fetched again on the next `get`."""
+    if key is None:
+      self.entries.clear()
+      self.fetching.clear()
+    else:
+      self.entries.pop(key, None)
+      self.fetching.pop(key, None)
+
+  def stats(self) -> CacheStats:
+    return CacheStats(self.hits, self.misses, len(self.entries))
@@ -0,0 +1,94 @@
+from typing_extensions import Sequence, TypeVar
+from dataclasses import dataclass, field
+from itertools import cycle
+import asyncio
+import grpc
+
+from typed_core.exceptions import ApiError
+
+T = TypeVar('T')
+
+ChannelOptions = Sequence[tuple[str, int | str]]
+
+KEEPALIVE_OPTIONS: ChannelOptions = (
+  ('grpc.keepalive_time_ms', 30_000),
+  ('grpc.keepalive_timeout_ms', 10_000),
+  ('grpc.keepalive_permit_without_calls', 1),
+  ('grpc.http2.max_pings_without_data', 0),
+)
+"""Ping idle connections, so that the first call after a quiet period doesn't pay for a reconnect."""
+
+def make_channel(url: str, *, secure: bool = True, options: ChannelOptions = KEEPALIVE_OPTIONS) -> grpc.Channel:
+  """A channel with its own connection (not shared with other channels to the same `url`)."""
+  url = url.split('://', 1)[-1]
+  options = [*options, ('grpc.use_local_subchannel_pool', 1)]
+  if secure:
+    return grpc.secure_channel(url, grpc.ssl_channel_credentials(), options=options)
+  return grpc.insecure_channel(url, options=options)
+
+@dataclass
+class ChannelPool(grpc.Channel):
+  """Spreads calls across several channels (each with its own connection), round robin.
+
+  Since each HTTP/2 connection caps its concurrent streams, this caps the total at `len(channels)` times the server's limit.
+  """
+  channels: list[grpc.Channel]
+  next: 'cycle[grpc.Channel]' = field(init=False, repr=False)
+
+  def __post_init__(self):
+    self.next = cycle(self.channels)
+
+  @classmethod
+  def new(cls, url: str, size: int, *, secure: bool = True, options: ChannelOptions = KEEPALIVE_OPTIONS) -> 'ChannelPool':
+    return cls([make_channel(url, secure=secure, options=options) for _ in range(size)])
+
+  def unary_unary(self, method, *args, **kwargs):
+    return next(self.next).unary_unary(method, *args, **kwargs)
+
+  def unary_stream(self, method, *args, **kwargs):
+    return next(self.next).unary_stream(method, *args, **kwargs)
+
+  def stream_unary(self, method, *args, **kwargs):
+    return next(self.next).stream_unary(method, *args, **kwargs)
+
+  def stream_stream(self, method, *args, **kwargs):
+    return next(self.next).stream_stream(method, *args, **kwargs)
+
+  def subscribe(self, callback, try_to_connect=False):
+    for channel in self.channels:
+      channel.subscribe(callback, try_to_connect)
+
+  def unsubscribe(self, callback):
+    for channel in self.channels:
+      channel.unsubscribe(callback)
+
+  def close(self):
+    for channel in self.channels:
+      channel.close()
+
+def make_channels(url: str, *, pool_size: int = 1, secure: bool = True, options: ChannelOptions = KEEPALIVE_OPTIONS) -> grpc.Channel:
+  if pool_size < 1:
+    raise ValueError(f'pool_size must be at least 1, got {pool_size}')
+  if pool_size == 1:
+    return make_channel(url, secure=secure, options=options)
+  return ChannelPool.new(url, pool_size, secure=secure, options=options)
+
+async def wait(call: grpc.Future) -> T: # type: ignore
+  """Await a call started with `.future(...)` without blocking the event loop. Errors are raised as `ApiError`."""
+  loop = asyncio.get_running_loop()
+  fut = loop.create_future()
+
+  def settle(call: grpc.Future):
+    if fut.cancelled():
+      return
+    if (e := call.exception()) is not None:
+      fut.set_exception(ApiError(e.code(), e.details()) if isinstance(e, grpc.RpcError) else e) # type: ignore
+    else:
+      fut.set_result(call.result())
+
+  call.add_done_callback(lambda call: loop.call_soon_threadsafe(settle, call))
+  try:
+    return await fut
+  except asyncio.CancelledError:
+    call.cancel()
+    raise
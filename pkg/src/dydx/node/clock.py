@@ -0,0 +1,123 @@
+from typing_extensions import Any, AsyncIterable
+from dataclasses import dataclass, field
+from datetime import datetime
+import asyncio
+import logging
+import time
+
+from dydx_v4_client.node.client import NodeClient
+from v4_proto.cosmos.base.tendermint.v1beta1 import query_pb2_grpc
+from v4_proto.cosmos.base.tendermint.v1beta1.query_pb2 import GetLatestBlockRequest, GetLatestBlockResponse
+from dydx.core import SHORT_BLOCK_WINDOW
+from dydx.indexer.data.core import parse_datetime
+from dydx.node.channels import wait
+
+logger = logging.getLogger('dydx.node.clock')
+
+BLOCK_TIME = 1
+"""Approximate block time, in seconds."""
+MAX_STALENESS = SHORT_BLOCK_WINDOW * BLOCK_TIME / 4
+"""Max. allowed `BlockClock.max_age`: a quarter of the short-term window."""
+
+@dataclass(frozen=True)
+class Block:
+  height: int
+  time: int
+  """Block time, in seconds since the epoch."""
+
+@dataclass
+class BlockClock:
+  """Latest block height and time, kept in memory so that placing/cancelling orders doesn't need a `latest_block()` round trip.
+
+  It's fetched on demand (when older than `max_age`), and can be kept fresh by polling the node in the background (opt-in, between `start` and `stop`) or by `update`/`follow` (e.g. from the indexer's `v4_block_height` stream).
+
+  ```python
+  async with DYDX.new() as dydx:
+    stream = await dydx.indexer.streams.block_height()
+    asyncio.create_task(dydx.node.block_clock.follow(stream))
+  ```
+  """
+  node_client: NodeClient
+  max_age: float = 2
+  """Max. age (in seconds) of the cached block before `block` fetches a new one.
+
+  Good-til-blocks are computed from the cached height, so each block it lags behind (about one per second) is a block less of the `SHORT_BLOCK_WINDOW` for short-term orders and cancels; one that lags by the whole window is rejected. Hence at most `MAX_STALENESS`.
+  """
+  interval: float = 0.5
+  """Polling interval (in seconds)."""
+  last: Block | None = field(default=None, init=False)
+  updated_at: float = field(default=float('-inf'), init=False, repr=False)
+  """`time.monotonic()` of the last update."""
+  fetching: asyncio.Future | None = field(default=None, init=False, repr=False)
+  task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+  def __post_init__(self):
+    if not 0 <= self.max_age <= MAX_STALENESS:
+      raise ValueError(f'max_age must be between 0 and {MAX_STALENESS} seconds, got {self.max_age}')
+
+  @property
+  def age(self) -> float:
+    """Seconds since the last update."""
+    return time.monotonic() - self.updated_at
+
+  def update(self, height: int, timestamp: int | datetime | str):
+    """Record a block (ignored if older than the current one).
+
+    - `height`: block height
+    - `timestamp`: block time, as seconds since the epoch, a `datetime` or an ISO string
+    """
+    if isinstance(timestamp, str):
+      timestamp = parse_datetime(timestamp)
+    if isinstance(timestamp, datetime):
+      timestamp = int(timestamp.timestamp())
+    if self.last is None or height >= self.last.height:
+      self.last = Block(height, timestamp)
+      self.updated_at = time.monotonic()
+
+  async def fetch(self) -> Block:
+    """Fetch the latest block from the node, without blocking the event loop. Concurrent calls share a single request."""
+    if self.fetching is None:
+      stub = query_pb2_grpc.ServiceStub(self.node_client.channel)
+      self.fetching = asyncio.ensure_future(wait(stub.GetLatestBlock.future(GetLatestBlockRequest())))
+    fut = self.fetching
+    try:
+      latest: GetLatestBlockResponse = await asyncio.shield(fut)
+    finally:
+      if fut.done() and self.fetching is fut:
+        self.fetching = None
+    header = latest.block.header
+    self.update(header.height, header.time.seconds)
+    return self.last # type: ignore
+
+  async def block(self) -> Block:
+    """The latest block, from memory if not older than `max_age`."""
+    if self.last is not None and self.age <= self.max_age:
+      return self.last
+    return await self.fetch()
+
+  async def follow(self, stream: AsyncIterable[Any]):
+    """Update from a `v4_block_height` stream (`Indexer.streams.block_height()`) until it ends."""
+    async for msg in stream:
+      self.update(int(msg['blockHeight']), msg['time'])
+
+  async def poll(self):
+    while True:
+      try:
+        await self.fetch()
+      except Exception as e:
+        logger.warning(f'Failed to fetch the latest block: {e}')
+      await asyncio.sleep(self.interval)
+
+  def start(self):
+    """Start polling the node in the background, every `interval` seconds (until `stop`)."""
+    if self.task is None or self.task.done():
+      self.task = asyncio.create_task(self.poll())
+
+  async def stop(self):
+    if self.task is not None:
+      self.task.cancel()
+      try:
+        await self.task
+      except asyncio.CancelledError:
+        pass
+      self.task = None
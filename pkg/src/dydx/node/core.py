@@ -1,63 +1,76 @@
 import os
 import asyncio
+import grpc
 from dataclasses import dataclass, field
 
-from dydx_v4_client.node.client import NodeClient, Builder, SequenceManager, QueryNodeClient
+from dydx_v4_client.node.client import NodeClient, Builder
+from dydx_v4_client.node.builder import TxOptions
+from v4_proto.cosmos.tx.v1beta1 import service_pb2_grpc
+from v4_proto.cosmos.tx.v1beta1.service_pb2 import BroadcastTxRequest, BroadcastTxResponse, BroadcastMode
 from dydx_v4_client.key_pair import KeyPair
 from dydx_v4_client.wallet import Wallet
-from dydx_v4_client.network import make_mainnet, make_secure, testnet_node
-
+from dydx_v4_client.network import NodeConfig, mainnet_node, testnet_node
+
+from dydx.node.channels import ChannelOptions, KEEPALIVE_OPTIONS, make_channel, make_channels, wait
+from dydx.node.cache import TTLCache
+from dydx.node.clock import BlockClock
+from dydx.node.market import MarketSpecs
+from dydx.node.tx_builder import CachedWallet, TxBuilder
+from dydx.node.sequence import SequenceAllocator, fetch_account, is_short_term, is_wrong_sequence
 from dydx.indexer import INDEXER_HTTP_URL, INDEXER_WS_URL, INDEXER_TESTNET_HTTP_URL, INDEXER_TESTNET_WS_URL
 
 OEGS_GRPC_URL = 'oegs.dydx.trade:443'
 TESTNET_GRPC_URL = 'test-dydx-grpc.kingnodes.com'
+MAX_ATTEMPTS = 3
+"""Broadcasts of a stateful message, retrying after account sequence mismatches (the first resync may only catch up with the committed sequence)."""
+
+def node_client_of(config: NodeConfig) -> NodeClient:
+  # no `SequenceManager`: sequences are allocated by `PrivateNodeMixin.sequences`
+  return NodeClient(config.channel, Builder(config.chain_id, config.usdc_denom))
 
 def make_node_client(
   url: str, *, rest_indexer: str = INDEXER_HTTP_URL,
   websocket_indexer: str = INDEXER_WS_URL,
+  pool_size: int = 1, options: ChannelOptions = KEEPALIVE_OPTIONS,
 ) -> NodeClient:
-  config = make_mainnet( 
-    node_url=url,
-    rest_indexer=rest_indexer, 
-    websocket_indexer=websocket_indexer, 
-  ).node
-  node = NodeClient(config.channel, Builder(config.chain_id, config.usdc_denom))
-  if node.manage_sequence:
-    node.sequence_manager = SequenceManager(QueryNodeClient(node.channel))
-  return node
+  """Node client for mainnet.
+
+  - `url`: gRPC URL of the node
+  - `rest_indexer`, `websocket_indexer`: unused by the node client (the indexer is configured on `Indexer`), still accepted for compatibility
+  - `pool_size`: number of connections to spread calls across (see `ChannelPool`)
+  - `options`: gRPC channel options (keepalive by default)
+  """
+  return node_client_of(mainnet_node(channel=make_channels(url, pool_size=pool_size, options=options)))
 
 def make_testnet_node_client(
   url: str, *, rest_indexer: str = INDEXER_TESTNET_HTTP_URL,
   websocket_indexer: str = INDEXER_TESTNET_WS_URL,
+  pool_size: int = 1, options: ChannelOptions = KEEPALIVE_OPTIONS,
 ) -> NodeClient:
-  config = make_secure(
-    testnet_node,
-    node_url=url,
-    rest_indexer=rest_indexer,
-    websocket_indexer=websocket_indexer,
-  ).node
-  node = NodeClient(config.channel, Builder(config.chain_id, config.usdc_denom))
-  if node.manage_sequence:
-    node.sequence_manager = SequenceManager(QueryNodeClient(node.channel))
-  return node
-
-async def load_wallet(node: NodeClient, mnemonic: str):
+  """Node client for testnet. See `make_node_client`."""
+  return node_client_of(testnet_node(channel=make_channels(url, pool_size=pool_size, options=options)))
+
+async def load_wallet(node: NodeClient, mnemonic: str) -> CachedWallet:
   pair = KeyPair.from_mnemonic(mnemonic)
-  address = Wallet(pair, 0, 0).address
-  return await Wallet.from_mnemonic(node, mnemonic, address)
+  address = CachedWallet(pair, 0, 0).address
+  account = await fetch_account(node, address)
+  return CachedWallet(pair, account.account_number, account.sequence)
 
 @dataclass
 class PublicNodeMixin:
   node_client: NodeClient = field(kw_only=True)
+  cache: TTLCache = field(default_factory=TTLCache, kw_only=True, repr=False)
+  """Cache of rarely changing reference data (clob pairs, fee tiers). Set `cache.ttl` to tune it, `cache.invalidate()` to refresh it."""
   
   @classmethod
   def public(
     cls, *, url: str = OEGS_GRPC_URL,
     rest_indexer: str = INDEXER_HTTP_URL,
     websocket_indexer: str = INDEXER_WS_URL,
+    pool_size: int = 1,
   ):
     return cls(
-      node_client=make_node_client(url, rest_indexer=rest_indexer, websocket_indexer=websocket_indexer),
+      node_client=make_node_client(url, pool_size=pool_size),
     )
 
   @classmethod
@@ -65,9 +78,10 @@ class PublicNodeMixin:
     cls, *, url: str = TESTNET_GRPC_URL,
     rest_indexer: str = INDEXER_TESTNET_HTTP_URL,
     websocket_indexer: str = INDEXER_TESTNET_WS_URL,
+    pool_size: int = 1,
   ):
     return cls(
-      node_client=make_testnet_node_client(url, rest_indexer=rest_indexer, websocket_indexer=websocket_indexer),
+      node_client=make_testnet_node_client(url, pool_size=pool_size),
     )
 
   async def __aenter__(self):
@@ -79,8 +93,70 @@ class PublicNodeMixin:
 @dataclass(kw_only=True)
 class PrivateNodeMixin(PublicNodeMixin):
   mnemonic: str = field(repr=False)
+  broadcast_channel: grpc.Channel | None = field(default=None, repr=False)
+  """Channel for broadcasts, kept apart from queries so that they never wait behind them (default: the node client's)."""
   lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
   wallet_future: asyncio.Future[Wallet] = field(default_factory=asyncio.Future, init=False, repr=False)
+  market_specs: MarketSpecs = field(default_factory=MarketSpecs, init=False, repr=False)
+  """Cached market parameters, used to build orders."""
+  block_clock: BlockClock = field(init=False, repr=False)
+  """Latest block, used for good-til-block(-time)s. Fetched on demand; call `block_clock.start()` to poll it in the background instead."""
+  tx_builder: TxBuilder | None = field(default=None, init=False, repr=False)
+  """Signer state, set once the wallet is loaded (see `signer`)."""
+  sequences: SequenceAllocator = field(init=False, repr=False)
+  """Local account sequence allocator, used by `broadcast`."""
+
+  def __post_init__(self):
+    self.block_clock = BlockClock(self.node_client)
+    self.sequences = SequenceAllocator(self.node_client)
+
+  async def signer(self) -> TxBuilder:
+    if self.tx_builder is None:
+      self.tx_builder = TxBuilder.of(await self.wallet, self.node_client.builder)
+    return self.tx_builder
+
+  async def broadcast_tx(self, tx_bytes: bytes, mode: BroadcastMode) -> BroadcastTxResponse:
+    """Broadcast a signed transaction, without blocking the event loop."""
+    channel = self.broadcast_channel or self.node_client.channel
+    request = BroadcastTxRequest(tx_bytes=tx_bytes, mode=mode)
+    return await wait(service_pb2_grpc.ServiceStub(channel).BroadcastTx.future(request))
+
+  async def broadcast(
+    self, message, *, mode: BroadcastMode = BroadcastMode.BROADCAST_MODE_SYNC,
+    tx_options: TxOptions | None = None,
+  ) -> BroadcastTxResponse:
+    """Sign and broadcast a message, with a locally allocated account sequence.
+
+    Short-term clob messages don't consume a sequence. Other messages reserve one (see `SequenceAllocator`), so several can be in flight at once; on an "account sequence mismatch" the sequence is resynced and the message retried (up to `MAX_ATTEMPTS` times in all).
+
+    - `message`: message to broadcast
+    - `tx_options`: if given (e.g. to use authenticators), they set the sequence, and `node_client.broadcast_message` is used as is
+    """
+    if tx_options is not None:
+      wallet = await self.wallet
+      return await self.node_client.broadcast_message(wallet, message, mode=mode, tx_options=tx_options)
+    signer = await self.signer()
+    messages = [signer.pack(message)]
+    if is_short_term(message):
+      seq = await self.sequences.current(signer.address)
+      return await self.broadcast_tx(signer.sign(messages, sequence=seq), mode)
+
+    for attempt in range(MAX_ATTEMPTS):
+      seq = await self.sequences.reserve(signer.address)
+      try:
+        tx = await self.broadcast_tx(signer.sign(messages, sequence=seq), mode)
+      except BaseException:
+        self.sequences.resync(seq)
+        raise
+      if tx.tx_response.code == 0:
+        self.sequences.confirm(seq)
+        break
+      if is_wrong_sequence(tx.tx_response):
+        self.sequences.mismatch(seq, tx.tx_response.raw_log)
+        continue
+      self.sequences.release(seq)
+      break
+    return tx # type: ignore
 
   @property
   async def address(self) -> str:
@@ -101,6 +177,8 @@ class PrivateNodeMixin(PublicNodeMixin):
     return self
 
   async def __aexit__(self, exc_type, exc_value, traceback):
+    await self.block_clock.stop()
+    self.tx_builder = None
     self.wallet_future.cancel()
     self.wallet_future = asyncio.Future()
   
@@ -109,19 +187,27 @@ class PrivateNodeMixin(PublicNodeMixin):
     cls, mnemonic: str | None = None, *, url: str = OEGS_GRPC_URL,
     rest_indexer: str = INDEXER_HTTP_URL,
     websocket_indexer: str = INDEXER_WS_URL,
+    pool_size: int = 1,
   ):
+    """
+    - `mnemonic`: wallet mnemonic (default: `DYDX_MNEMONIC` env var)
+    - `url`: gRPC URL of the node
+    - `rest_indexer`, `websocket_indexer`: unused (see `make_node_client`)
+    - `pool_size`: number of connections for queries (see `ChannelPool`). Broadcasts always use a separate connection.
+    """
     if mnemonic is None:
       mnemonic = os.environ['DYDX_MNEMONIC']
-    node_client = make_node_client(url, rest_indexer=rest_indexer, websocket_indexer=websocket_indexer)
-    return cls(node_client=node_client, mnemonic=mnemonic)
+    node_client = make_node_client(url, pool_size=pool_size)
+    return cls(node_client=node_client, mnemonic=mnemonic, broadcast_channel=make_channel(url))
 
   @classmethod
   def testnet(
     cls, mnemonic: str | None = None, *, url: str = TESTNET_GRPC_URL,
     rest_indexer: str = INDEXER_TESTNET_HTTP_URL,
     websocket_indexer: str = INDEXER_TESTNET_WS_URL,
+    pool_size: int = 1,
   ):
     if mnemonic is None:
       mnemonic = os.environ['DYDX_TESTNET_MNEMONIC']
-    node_client = make_testnet_node_client(url, rest_indexer=rest_indexer, websocket_indexer=websocket_indexer)
-    return cls(node_client=node_client, mnemonic=mnemonic)
\ No newline at end of file
+    node_client = make_testnet_node_client(url, pool_size=pool_size)
+    return cls(node_client=node_client, mnemonic=mnemonic, broadcast_channel=make_channel(url))
\ No newline at end of file
@@ -0,0 +1,108 @@
+from typing_extensions import Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from v4_proto.dydxprotocol.clob.order_pb2 import OrderId
+from dydx_v4_client.node.message import order_id
+
+from dydx.indexer.types import PerpetualMarket
+
+QUOTE_QUANTUMS_ATOMIC_RESOLUTION = -6
+
+def decimal(x) -> Decimal:
+  return x if isinstance(x, Decimal) else Decimal(str(x))
+
+def scale_floor(x: Decimal, exponent: int) -> int:
+  """`floor(x * 10**exponent)`, exactly (for non-negative `x`)."""
+  return int(x.scaleb(exponent))
+
+@dataclass(frozen=True)
+class MarketSpec:
+  """The parameters of a market needed to build orders, with exact conversions of sizes and prices into quantums and subticks.
+
+  Same results as `dydx_v4_client.node.market.Market`, but without going through `float`s.
+  """
+  ticker: str
+  clob_pair_id: int
+  atomic_resolution: int
+  quantum_conversion_exponent: int
+  step_base_quantums: int
+  subticks_per_tick: int
+  size_exponent: int
+  """`quantums = size * 10**size_exponent`"""
+  price_exponent: int
+  """`subticks = price * 10**price_exponent`"""
+
+  @classmethod
+  def of(cls, market: PerpetualMarket) -> 'MarketSpec':
+    atomic_resolution = int(market['atomicResolution'])
+    quantum_conversion_exponent = int(market['quantumConversionExponent'])
+    return cls(
+      ticker=market['ticker'],
+      clob_pair_id=int(market['clobPairId']),
+      atomic_resolution=atomic_resolution,
+      quantum_conversion_exponent=quantum_conversion_exponent,
+      step_base_quantums=int(market['stepBaseQuantums']),
+      subticks_per_tick=int(market['subticksPerTick']),
+      size_exponent=-atomic_resolution,
+      price_exponent=atomic_resolution - quantum_conversion_exponent - QUOTE_QUANTUMS_ATOMIC_RESOLUTION,
+    )
+
+  def matches(self, market: PerpetualMarket) -> bool:
+    """Whether `market` still has the same parameters."""
+    return (
+      self.atomic_resolution == market['atomicResolution']
+      and self.quantum_conversion_exponent == market['quantumConversionExponent']
+      and self.step_base_quantums == market['stepBaseQuantums']
+      and self.subticks_per_tick == market['subticksPerTick']
+    )
+
+  def quantums(self, size: Decimal) -> int:
+    """Size in base quantums, rounded down to a multiple of `step_base_quantums` (and at least one step)."""
+    size = decimal(size)
+    if not size.is_finite() or size < 0:
+      raise ValueError(f'Invalid size: {size}')
+    step = self.step_base_quantums
+    return max(scale_floor(size, self.size_exponent) // step * step, step)
+
+  def subticks(self, price: Decimal) -> int:
+    """Price in subticks, rounded down to a multiple of `subticks_per_tick` (and at least one tick)."""
+    price = decimal(price)
+    if not price.is_finite() or price < 0:
+      raise ValueError(f'Invalid price: {price}')
+    tick = self.subticks_per_tick
+    return max(scale_floor(price, self.price_exponent) // tick * tick, tick)
+
+  def order_id(self, *, address: str, subaccount: int, client_id: int, order_flags: int) -> OrderId:
+    return order_id(address, subaccount, client_id, self.clob_pair_id, order_flags)
+
+@dataclass
+class MarketSpecs:
+  """Cache of `MarketSpec`s, by ticker and by CLOB pair id."""
+  by_ticker: dict[str, MarketSpec] = field(default_factory=dict)
+  by_clob_pair_id: dict[int, MarketSpec] = field(default_factory=dict)
+
+  def __call__(self, market: PerpetualMarket | MarketSpec) -> MarketSpec:
+    """The (cached) spec of `market`."""
+    if isinstance(market, MarketSpec):
+      return market
+    spec = self.by_ticker.get(market['ticker'])
+    if spec is None or not spec.matches(market):
+      spec = self.add(market)
+    return spec
+
+  def add(self, market: PerpetualMarket) -> MarketSpec:
+    """Cache the spec of `market`, replacing the previous one (e.g. if its parameters changed)."""
+    spec = MarketSpec.of(market)
+    self.by_ticker[spec.ticker] = spec
+    self.by_clob_pair_id[spec.clob_pair_id] = spec
+    return spec
+
+  def update(self, markets: Mapping[str, PerpetualMarket]):
+    """Cache the specs of all `markets` (e.g. `get_markets()['markets']`)."""
+    for market in markets.values():
+      self.add(market)
+
+  def clear(self):
+    self.by_ticker.clear()
+    self.by_clob_pair_id.clear()
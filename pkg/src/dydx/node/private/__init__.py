@@ -3,7 +3,9 @@ from dataclasses import dataclass as _dataclass
 from .batch_cancel_orders import BatchCancelOrders
 from .cancel_order import CancelOrder
 from .place_order import PlaceOrder
+from .place_orders import PlaceOrders
+from .replace_orders import ReplaceOrders
 
 @_dataclass
-class PrivateNode(BatchCancelOrders, CancelOrder, PlaceOrder):
+class PrivateNode(BatchCancelOrders, CancelOrder, ReplaceOrders):
   ...
\ No newline at end of file
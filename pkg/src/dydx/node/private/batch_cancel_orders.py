@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from collections import defaultdict
 
 from dydx_v4_client import OrderFlags
-from v4_proto.dydxprotocol.clob.tx_pb2 import OrderBatch
+from v4_proto.dydxprotocol.clob.tx_pb2 import MsgBatchCancel, OrderBatch
 from v4_proto.dydxprotocol.clob.order_pb2 import OrderId
 from v4_proto.cosmos.tx.v1beta1.service_pb2 import BroadcastTxResponse
 
@@ -37,15 +37,14 @@ class BatchCancelOrders(PrivateNodeMixin):
     ]
 
     if good_til_block is None:
-      latest_block = await self.node_client.latest_block()
-      good_til_block = latest_block.block.header.height + SHORT_BLOCK_WINDOW
+      block = await self.block_clock.block()
+      good_til_block = block.height + SHORT_BLOCK_WINDOW
 
-    wallet = await self.wallet
-    r: BroadcastTxResponse = await self.node_client.batch_cancel_orders(
-      wallet=wallet, subaccount_id=subaccount_id,
+    r = await self.broadcast(MsgBatchCancel(
+      subaccount_id=subaccount_id,
       short_term_cancels=batches,
       good_til_block=good_til_block,
-    )
+    ))
     if r.tx_response.code != 0:
       raise ApiError(r.tx_response.code, r.tx_response)
     return r
\ No newline at end of file
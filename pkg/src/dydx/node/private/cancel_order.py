@@ -29,18 +29,15 @@ class CancelOrder(PrivateNodeMixin):
     """
     # SHORT-TERM orders required good_til_block
     if good_til_block is None and order_id.order_flags == OrderFlags.SHORT_TERM:
-      latest_block = await self.node_client.latest_block()
-      good_til_block = latest_block.block.header.height + SHORT_BLOCK_WINDOW
+      block = await self.block_clock.block()
+      good_til_block = block.height + SHORT_BLOCK_WINDOW
     # LONG-TERM orders required good_til_block_time
     elif good_til_block_time is None and order_id.order_flags == OrderFlags.LONG_TERM:
-      latest_block = await self.node_client.latest_block()
-      good_til_block_time = latest_block.block.header.time.seconds + STATEFUL_ORDER_TIME_WINDOW
+      block = await self.block_clock.block()
+      good_til_block_time = block.time + STATEFUL_ORDER_TIME_WINDOW
 
-    wallet = await self.wallet
     tx = MsgCancelOrder(order_id=order_id, good_til_block=good_til_block, good_til_block_time=good_til_block_time)
-    r: BroadcastTxResponse = await self.node_client.broadcast_message(
-      wallet, tx, mode=mode, tx_options=tx_options # type: ignore
-    )
+    r = await self.broadcast(tx, mode=mode, tx_options=tx_options)
     if r.tx_response.code != 0:
       raise ApiError(r.tx_response.code, r.tx_response)
     return r
\ No newline at end of file
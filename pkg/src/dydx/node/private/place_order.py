@@ -7,7 +7,6 @@ from v4_proto.dydxprotocol.clob.order_pb2 import Order as OrderProto
 from v4_proto.cosmos.tx.v1beta1.service_pb2 import BroadcastTxResponse, BroadcastMode
 from dydx_v4_client import OrderFlags
 from dydx_v4_client.wallet import Wallet
-from dydx_v4_client.node.market import Market
 from dydx_v4_client.indexer.rest.constants import OrderType
 from dydx_v4_client.node.builder import TxOptions
 
@@ -15,6 +14,8 @@ from typed_core.exceptions import ApiError
 from dydx.core import SHORT_BLOCK_WINDOW, STATEFUL_ORDER_TIME_WINDOW
 from dydx.indexer.types import PerpetualMarket
 from dydx.node.core import PrivateNodeMixin
+from dydx.node.market import MarketSpec
+from dydx.node.clock import Block
 
 Side = Literal['BUY', 'SELL']
 TimeInForce = Literal['GOOD_TIL_TIME', 'IMMEDIATE_OR_CANCEL', 'POST_ONLY', 'FILL_OR_KILL']
@@ -71,6 +72,32 @@ def parse_tif(tif: TimeInForce | None) -> OrderProto.TimeInForce:
     case _:
       return OrderProto.TimeInForce.TIME_IN_FORCE_UNSPECIFIED
 
+def needs_block(order: Order) -> bool:
+  """Whether the good-til-block(-time) of `order` is derived from the latest block."""
+  match order['flags']:
+    case 'SHORT_TERM':
+      return order.get('good_til_block') is None
+    case 'LONG_TERM':
+      return order.get('good_til_block_time') is None
+    case _:
+      return False
+
+def good_til(
+  order: Order, block: Block | None, *,
+  gtb_delta: int | None = None, gtbt_delta: int | None = None,
+) -> tuple[int | None, int | None]:
+  """Good-til-block and good-til-block-time of `order`, given the latest `block` (required if `needs_block(order)`)."""
+  gtb = order.get('good_til_block')
+  gtbt = order.get('good_til_block_time')
+  if gtb is None and order['flags'] == 'SHORT_TERM':
+    assert block is not None
+    gtb = block.height + (SHORT_BLOCK_WINDOW if gtb_delta is None else gtb_delta)
+  if gtbt is None and order['flags'] == 'LONG_TERM':
+    assert block is not None
+    gtbt = block.time + (STATEFUL_ORDER_TIME_WINDOW if gtbt_delta is None else gtbt_delta)
+    gtb = None
+  return gtb, gtbt
+
 class OrderResponse(TypedDict):
   tx: BroadcastTxResponse
   order: OrderProto
@@ -79,21 +106,25 @@ class OrderResponse(TypedDict):
 class PlaceOrder(PrivateNodeMixin):
 
   def build_order(
-    self, wallet: Wallet, *, market: PerpetualMarket, order: Order,
+    self, wallet: Wallet, *, market: PerpetualMarket | MarketSpec, order: Order,
     good_til_block: int | None = None, good_til_block_time: int | None = None,
     subaccount: int = 0,
   ):
-    mkt = Market(market) # type: ignore
+    """Build an order (without placing it).
+
+    Sizes and prices are converted exactly into quantums and subticks (rounded down to the market's step and tick), using the market's cached `MarketSpec`.
+    """
+    spec = self.market_specs(market)
     client_id = order.get('client_id') or rand_id()
-    order_id = mkt.order_id(
-      address=wallet.address, subaccount_number=subaccount,
+    order_id = spec.order_id(
+      address=wallet.address, subaccount=subaccount,
       client_id=client_id, order_flags=parse_flags(order['flags']),
     )
     return OrderProto(
       order_id=order_id,
       side=parse_side(order['side']),
-      quantums=mkt.calculate_quantums(float(order['size'])),
-      subticks=mkt.calculate_subticks(float(order['price'])),
+      quantums=spec.quantums(order['size']),
+      subticks=spec.subticks(order['price']),
       good_til_block=good_til_block,
       good_til_block_time=good_til_block_time,
       time_in_force=parse_tif(order.get('time_in_force')),
@@ -104,27 +135,16 @@ class PlaceOrder(PrivateNodeMixin):
     )
 
   async def build_order_now(
-    self, market: PerpetualMarket, order: Order, *, subaccount: int = 0,
+    self, market: PerpetualMarket | MarketSpec, order: Order, *, subaccount: int = 0,
     gtb_delta: int | None = None, gtbt_delta: int | None = None
   ):
-    if (gtb := order.get('good_til_block')) is None and order['flags'] == 'SHORT_TERM':
-      latest_block = await self.node_client.latest_block()
-      if gtb_delta is None:
-        gtb_delta = SHORT_BLOCK_WINDOW
-      gtb = latest_block.block.header.height + gtb_delta
-
-    if (gtbt := order.get('good_til_block_time')) is None and order['flags'] == 'LONG_TERM':
-      latest_block = await self.node_client.latest_block()
-      if gtbt_delta is None:
-        gtbt_delta = STATEFUL_ORDER_TIME_WINDOW
-      gtbt = latest_block.block.header.time.seconds + gtbt_delta
-      gtb = None
-
+    block = await self.block_clock.block() if needs_block(order) else None
+    gtb, gtbt = good_til(order, block, gtb_delta=gtb_delta, gtbt_delta=gtbt_delta)
     wallet = await self.wallet
     return self.build_order(wallet=wallet, market=market, order=order, good_til_block=gtb, good_til_block_time=gtbt, subaccount=subaccount)
 
   async def place_order(
-    self, market: PerpetualMarket, order: Order, *, subaccount: int = 0,
+    self, market: PerpetualMarket | MarketSpec, order: Order, *, subaccount: int = 0,
     mode: BroadcastMode = BroadcastMode.BROADCAST_MODE_SYNC, tx_options: TxOptions | None = None,
     gtb_delta: int | None = None, gtbt_delta: int | None = None,
     good_til_block: int | None = None, good_til_block_time: int | None = None,
@@ -144,10 +164,7 @@ class PlaceOrder(PrivateNodeMixin):
       order_proto = self.build_order(wallet=wallet, market=market, order=order, good_til_block=good_til_block, good_til_block_time=good_til_block_time, subaccount=subaccount)
     else:
       order_proto = await self.build_order_now(market=market, order=order, subaccount=subaccount, gtb_delta=gtb_delta, gtbt_delta=gtbt_delta)
-    tx: BroadcastTxResponse = await self.node_client.broadcast_message(
-      wallet, MsgPlaceOrder(order=order_proto), # type: ignore
-      mode=mode, tx_options=tx_options
-    )
+    tx = await self.broadcast(MsgPlaceOrder(order=order_proto), mode=mode, tx_options=tx_options)
     if tx.tx_response.code != 0:
       raise ApiError(tx.tx_response.code, tx.tx_response, tx.tx_response.raw_log)
     return {
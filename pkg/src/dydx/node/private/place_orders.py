@@ -0,0 +1,100 @@
+from typing_extensions import Awaitable, Callable, TypedDict, TypeVar, NotRequired, Sequence
+from dataclasses import dataclass
+from functools import partial
+import asyncio
+
+from v4_proto.dydxprotocol.clob.tx_pb2 import MsgPlaceOrder
+from v4_proto.dydxprotocol.clob.order_pb2 import Order as OrderProto, OrderId
+from v4_proto.cosmos.tx.v1beta1.service_pb2 import BroadcastTxResponse, BroadcastMode
+from dydx_v4_client import OrderFlags
+
+from typed_core.exceptions import ApiError
+from dydx.indexer.types import PerpetualMarket
+from dydx.node.market import MarketSpec
+from dydx.node.clock import Block
+from .place_order import PlaceOrder, Order, needs_block, good_til
+
+T = TypeVar('T')
+
+def is_stateful(order_id: OrderId) -> bool:
+  return order_id.order_flags != OrderFlags.SHORT_TERM
+
+async def pipeline(jobs: Sequence[tuple[bool, Callable[[], Awaitable[T]]]]) -> list[T]:
+  """Run broadcast jobs `(stateful, job)`, returning their results in the same order.
+
+  Short-term jobs run concurrently. Stateful ones (long-term and conditional orders and cancels) run one after the other, so that their (locally allocated) account sequences reach the node in order.
+  """
+  results: list = [None] * len(jobs)
+
+  async def run(i: int, job: Callable[[], Awaitable[T]]):
+    results[i] = await job()
+
+  async def stateful():
+    for i, (sequenced, job) in enumerate(jobs):
+      if sequenced:
+        await run(i, job)
+
+  await asyncio.gather(stateful(), *(run(i, job) for i, (sequenced, job) in enumerate(jobs) if not sequenced))
+  return results
+
+class OrderResult(TypedDict):
+  order: OrderProto
+  tx: NotRequired[BroadcastTxResponse]
+  """Set if the order was accepted."""
+  error: NotRequired[Exception]
+  """Set if the order was rejected (`ApiError`) or couldn't be broadcast."""
+
+@dataclass
+class PlaceOrders(PlaceOrder):
+  async def build_orders(
+    self, market: PerpetualMarket | MarketSpec, orders: Sequence[Order], *, subaccount: int = 0,
+    gtb_delta: int | None = None, gtbt_delta: int | None = None, block: Block | None = None,
+  ) -> list[OrderProto]:
+    """Build many orders of a market, with a single block lookup (unless `block` is given)."""
+    if block is None and any(needs_block(o) for o in orders):
+      block = await self.block_clock.block()
+    wallet = await self.wallet
+    spec = self.market_specs(market)
+    out: list[OrderProto] = []
+    for order in orders:
+      gtb, gtbt = good_til(order, block, gtb_delta=gtb_delta, gtbt_delta=gtbt_delta)
+      out.append(self.build_order(wallet, market=spec, order=order, good_til_block=gtb, good_til_block_time=gtbt, subaccount=subaccount))
+    return out
+
+  async def broadcast_order(self, order: OrderProto, *, mode: BroadcastMode) -> OrderResult:
+    try:
+      tx = await self.broadcast(MsgPlaceOrder(order=order), mode=mode)
+      if tx.tx_response.code != 0:
+        raise ApiError(tx.tx_response.code, tx.tx_response, tx.tx_response.raw_log)
+      return {'order': order, 'tx': tx}
+    except Exception as e:
+      return {'order': order, 'error': e}
+
+  async def broadcast_orders(
+    self, orders: Sequence[OrderProto], *, mode: BroadcastMode = BroadcastMode.BROADCAST_MODE_SYNC,
+  ) -> list[OrderResult]:
+    """Broadcast already built orders, returning a result per order (in the same order). See `pipeline`."""
+    return await pipeline([
+      (is_stateful(o.order_id), partial(self.broadcast_order, o, mode=mode))
+      for o in orders
+    ])
+
+  async def place_orders(
+    self, market: PerpetualMarket | MarketSpec, orders: Sequence[Order], *, subaccount: int = 0,
+    mode: BroadcastMode = BroadcastMode.BROADCAST_MODE_SYNC,
+    gtb_delta: int | None = None, gtbt_delta: int | None = None,
+  ) -> list[OrderResult]:
+    """Place many orders of a market at once, e.g. to requote.
+
+    Orders are built together (one block lookup) and broadcast without waiting for each other (see `broadcast_orders`). Each order still goes in its own transaction: the dYdX chain rejects transactions with more than one order message.
+
+    Failures don't raise: each result has either the order's `tx` or its `error`.
+
+    - `market`: market to place the orders on
+    - `orders`: orders to place
+    - `subaccount`: subaccount to place the orders on
+    - `gtb_delta`: sets good-til-block for short-term orders to `current_block() + gtb_delta`
+    - `gtbt_delta`: sets good-til-block-time (in seconds) for long-term-orders to  `current_block().time.seconds + gtbt_delta`
+    """
+    built = await self.build_orders(market, orders, subaccount=subaccount, gtb_delta=gtb_delta, gtbt_delta=gtbt_delta)
+    return await self.broadcast_orders(built, mode=mode)
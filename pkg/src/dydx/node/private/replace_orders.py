@@ -0,0 +1,89 @@
+from typing_extensions import TypedDict, NotRequired, Sequence
+from dataclasses import dataclass
+from collections import defaultdict
+from functools import partial
+
+from v4_proto.dydxprotocol.clob.tx_pb2 import MsgBatchCancel, MsgCancelOrder, OrderBatch
+from v4_proto.dydxprotocol.clob.order_pb2 import OrderId
+from v4_proto.dydxprotocol.subaccounts.subaccount_pb2 import SubaccountId
+from v4_proto.cosmos.tx.v1beta1.service_pb2 import BroadcastTxResponse, BroadcastMode
+
+from typed_core.exceptions import ApiError
+from dydx.core import SHORT_BLOCK_WINDOW, STATEFUL_ORDER_TIME_WINDOW
+from dydx.indexer.types import PerpetualMarket
+from dydx.node.market import MarketSpec
+from .place_order import Order, needs_block
+from .place_orders import PlaceOrders, OrderResult, pipeline, is_stateful
+
+class CancelResult(TypedDict):
+  order_ids: list[OrderId]
+  """Orders cancelled by the transaction (short-term cancels of a subaccount go in a single batch)."""
+  tx: NotRequired[BroadcastTxResponse]
+  error: NotRequired[Exception]
+
+class ReplaceResult(TypedDict):
+  cancels: list[CancelResult]
+  places: list[OrderResult]
+
+@dataclass
+class ReplaceOrders(PlaceOrders):
+  async def broadcast_cancel(self, msg, order_ids: list[OrderId], *, mode: BroadcastMode) -> CancelResult:
+    try:
+      tx = await self.broadcast(msg, mode=mode)
+      if tx.tx_response.code != 0:
+        raise ApiError(tx.tx_response.code, tx.tx_response, tx.tx_response.raw_log)
+      return {'order_ids': order_ids, 'tx': tx}
+    except Exception as e:
+      return {'order_ids': order_ids, 'error': e}
+
+  async def replace_orders(
+    self, cancels: Sequence[OrderId], places: Sequence[Order], *,
+    market: PerpetualMarket | MarketSpec, subaccount: int = 0,
+    mode: BroadcastMode = BroadcastMode.BROADCAST_MODE_SYNC,
+    gtb_delta: int | None = None, gtbt_delta: int | None = None,
+  ) -> ReplaceResult:
+    """Cancel some orders and place new ones of a market (i.e. requote), with a single block lookup.
+
+    Cancels and places are broadcast together without waiting for each other (see `pipeline`), so the new quotes rest as soon as the old ones go. Short-term cancels are batched, one transaction per subaccount. The dYdX chain doesn't accept clob messages together with other messages, so it can't be a single transaction.
+
+    Failures don't raise: each result has either its `tx` or its `error`.
+
+    - `cancels`: orders to cancel
+    - `places`: orders to place
+    - `market`: market to place the orders on
+    - `subaccount`: subaccount to place the orders on
+    - `gtb_delta`: sets good-til-block for short-term orders to `current_block() + gtb_delta`
+    - `gtbt_delta`: sets good-til-block-time (in seconds) for long-term-orders to  `current_block().time.seconds + gtbt_delta`
+    """
+    block = None
+    if cancels or any(needs_block(o) for o in places):
+      block = await self.block_clock.block()
+    built = await self.build_orders(market, places, subaccount=subaccount, gtb_delta=gtb_delta, gtbt_delta=gtbt_delta, block=block)
+
+    short_term = defaultdict[tuple[str, int], defaultdict[int, list[OrderId]]](lambda: defaultdict(list))
+    jobs = []
+    for order_id in cancels:
+      if is_stateful(order_id):
+        msg = MsgCancelOrder(order_id=order_id, good_til_block_time=block.time + STATEFUL_ORDER_TIME_WINDOW) # type: ignore
+        jobs.append((True, partial(self.broadcast_cancel, msg, [order_id], mode=mode)))
+      else:
+        sub = order_id.subaccount_id
+        short_term[(sub.owner, sub.number)][order_id.clob_pair_id].append(order_id)
+    for (owner, number), by_pair in short_term.items():
+      msg = MsgBatchCancel(
+        subaccount_id=SubaccountId(owner=owner, number=number),
+        short_term_cancels=[
+          OrderBatch(clob_pair_id=pair, client_ids=[id.client_id for id in ids])
+          for pair, ids in by_pair.items()
+        ],
+        good_til_block=block.height + SHORT_BLOCK_WINDOW, # type: ignore
+      )
+      order_ids = [id for ids in by_pair.values() for id in ids]
+      jobs.append((False, partial(self.broadcast_cancel, msg, order_ids, mode=mode)))
+    cancel_jobs = len(jobs)
+    jobs.extend(
+      (is_stateful(o.order_id), partial(self.broadcast_order, o, mode=mode))
+      for o in built
+    )
+    results = await pipeline(jobs)
+    return {'cancels': results[:cancel_jobs], 'places': results[cancel_jobs:]}
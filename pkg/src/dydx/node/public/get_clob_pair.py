@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 
-from grpc._channel import _InactiveRpcError
-
+from v4_proto.dydxprotocol.clob import query_pb2_grpc
+from v4_proto.dydxprotocol.clob.query_pb2 import QueryGetClobPairRequest, QueryClobPairResponse
 from v4_proto.dydxprotocol.clob.clob_pair_pb2 import ClobPair
-from typed_core.exceptions import ApiError
 from dydx.node.core import PublicNodeMixin
+from dydx.node.channels import wait
 
 @dataclass
 class GetClobPair(PublicNodeMixin):
@@ -14,9 +14,13 @@ class GetClobPair(PublicNodeMixin):
 
     - `id`: The id of the CLOB pair.
 
+    Results are cached for `self.cache.ttl` seconds.
+
     > [dYdX API docs](https://docs.dydx.xyz/node-client/public#get-clob-pair)
     """
-    try:
-      return await self.node_client.get_clob_pair(id)
-    except _InactiveRpcError as e:
-      raise ApiError(e._state.code, e._state.details)
\ No newline at end of file
+    return await self.cache.get(('clob_pair', id), lambda: self.fetch_clob_pair(id))
+
+  async def fetch_clob_pair(self, id: int) -> ClobPair:
+    stub = query_pb2_grpc.QueryStub(self.node_client.channel)
+    r: QueryClobPairResponse = await wait(stub.ClobPair.future(QueryGetClobPairRequest(id=id)))
+    return r.clob_pair
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from grpc._channel import _InactiveRpcError
+from v4_proto.dydxprotocol.prices import query_pb2_grpc
+from v4_proto.dydxprotocol.prices.query_pb2 import QueryMarketPriceRequest, QueryMarketPriceResponse
 
-from typed_core.exceptions import ApiError
 from dydx.node.core import PublicNodeMixin
+from dydx.node.channels import wait
 
 @dataclass
 class GetPrice(PublicNodeMixin):
@@ -16,8 +17,6 @@ class GetPrice(PublicNodeMixin):
 
     > [dYdX API docs](https://docs.dydx.xyz/node-client/public#get-price)
     """
-    try:
-      r = await self.node_client.get_price(id)
-      return Decimal(r.price) * Decimal(f'1e{r.exponent}')
-    except _InactiveRpcError as e:
-      raise ApiError(e._state.code, e._state.details)
\ No newline at end of file
+    stub = query_pb2_grpc.QueryStub(self.node_client.channel)
+    r: QueryMarketPriceResponse = await wait(stub.MarketPrice.future(QueryMarketPriceRequest(id=id)))
+    return Decimal(r.market_price.price).scaleb(r.market_price.exponent)
@@ -0,0 +1,36 @@
+from typing_extensions import Collection
+from dataclasses import dataclass
+from decimal import Decimal
+
+from v4_proto.dydxprotocol.prices import query_pb2_grpc
+from v4_proto.dydxprotocol.prices.query_pb2 import QueryAllMarketPricesRequest, QueryAllMarketPricesResponse
+from v4_proto.cosmos.base.query.v1beta1.pagination_pb2 import PageRequest
+
+from dydx.node.core import PublicNodeMixin
+from dydx.node.channels import wait
+
+PAGE_LIMIT = 1000
+
+@dataclass
+class GetPrices(PublicNodeMixin):
+  async def get_prices(self, ids: Collection[int] | None = None) -> dict[int, Decimal]:
+    """
+    Retrieve the current oracle prices of many markets at once (one request per 1000 markets), by market ID.
+
+    - `ids`: The ids of the markets to return (default: all).
+
+    > [dYdX API docs](https://docs.dydx.xyz/node-client/public#get-prices)
+    """
+    stub = query_pb2_grpc.QueryStub(self.node_client.channel)
+    wanted = None if ids is None else set(ids)
+    prices: dict[int, Decimal] = {}
+    key = b''
+    while True:
+      request = QueryAllMarketPricesRequest(pagination=PageRequest(key=key, limit=PAGE_LIMIT))
+      r: QueryAllMarketPricesResponse = await wait(stub.AllMarketPrices.future(request))
+      for p in r.market_prices:
+        if wanted is None or p.id in wanted:
+          prices[p.id] = Decimal(p.price).scaleb(p.exponent)
+      key = r.pagination.next_key
+      if not key or wanted is not None and len(prices) == len(wanted):
+        return prices
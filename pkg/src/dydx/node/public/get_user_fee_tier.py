@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from grpc._channel import _InactiveRpcError
+from v4_proto.dydxprotocol.feetiers import query_pb2_grpc
+from v4_proto.dydxprotocol.feetiers.query_pb2 import QueryUserFeeTierRequest, QueryUserFeeTierResponse
 
-from typed_core.exceptions import ApiError
 from dydx.node.core import PublicNodeMixin
+from dydx.node.channels import wait
 
 @dataclass
 class FeeTier:
@@ -21,13 +22,16 @@ class GetUserFeeTier(PublicNodeMixin):
 
     - `address`: The wallet address that owns the account.
 
+    Results are cached for `self.cache.ttl` seconds.
+
     > [dYdX API docs](https://docs.dydx.xyz/node-client/public#get-fee-tiers)
     """
-    try:
-      r = await self.node_client.get_user_fee_tier(address)
-      return FeeTier(
-        maker=Decimal(r.tier.maker_fee_ppm) / Decimal('1e6'),
-        taker=Decimal(r.tier.taker_fee_ppm) / Decimal('1e6'),
-      )
-    except _InactiveRpcError as e:
-      raise ApiError(e._state.code, e._state.details)
+    return await self.cache.get(('user_fee_tier', address), lambda: self.fetch_user_fee_tier(address))
+
+  async def fetch_user_fee_tier(self, address: str) -> FeeTier:
+    stub = query_pb2_grpc.QueryStub(self.node_client.channel)
+    r: QueryUserFeeTierResponse = await wait(stub.UserFeeTier.future(QueryUserFeeTierRequest(user=address)))
+    return FeeTier(
+      maker=Decimal(r.tier.maker_fee_ppm) / Decimal('1e6'),
+      taker=Decimal(r.tier.taker_fee_ppm) / Decimal('1e6'),
+    )
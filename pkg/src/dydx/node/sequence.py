@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+import asyncio
+import logging
+import re
+
+from v4_proto.cosmos.auth.v1beta1 import query_pb2_grpc
+from v4_proto.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
+from v4_proto.cosmos.auth.v1beta1.query_pb2 import QueryAccountRequest, QueryAccountResponse
+from v4_proto.dydxprotocol.clob.tx_pb2 import MsgPlaceOrder, MsgCancelOrder, MsgBatchCancel
+from dydx_v4_client import OrderFlags
+from dydx_v4_client.node.client import NodeClient
+from typed_core import LogicError
+from dydx.node.channels import wait
+
+logger = logging.getLogger('dydx.node.sequence')
+
+WRONG_SEQUENCE = 32
+"""Cosmos SDK error code for "account sequence mismatch" (codespace `sdk`)."""
+EXPECTED_SEQUENCE = re.compile(r'expected (\d+)')
+
+def is_short_term(message) -> bool:
+  """Whether `message` is a short-term clob message, which doesn't use (nor increment) the account sequence."""
+  if isinstance(message, MsgPlaceOrder):
+    return message.order.order_id.order_flags == OrderFlags.SHORT_TERM
+  if isinstance(message, MsgCancelOrder):
+    return message.order_id.order_flags == OrderFlags.SHORT_TERM
+  return isinstance(message, MsgBatchCancel)
+
+def is_wrong_sequence(tx_response) -> bool:
+  return tx_response.code == WRONG_SEQUENCE and tx_response.codespace == 'sdk'
+
+async def fetch_account(node_client: NodeClient, address: str) -> BaseAccount:
+  """The account of `address` (number and sequence), fetched without blocking the event loop."""
+  stub = query_pb2_grpc.QueryStub(node_client.channel)
+  r: QueryAccountResponse = await wait(stub.Account.future(QueryAccountRequest(address=address)))
+  account = BaseAccount()
+  if not r.account.Unpack(account):
+    raise LogicError(f'Unexpected account type: {r.account.type_url}')
+  return account
+
+@dataclass
+class SequenceAllocator:
+  """Account sequence numbers, allocated locally (instead of querying the account before every transaction).
+
+  Sequences are reserved optimistically, so that several stateful transactions can be in flight at once. Each reservation is settled once its transaction's outcome is known: `confirm` if accepted, `release` if rejected (which doesn't consume its sequence), `mismatch` on an "account sequence mismatch", `resync` if unknown.
+
+  `next` never goes back below a sequence still in flight: when a settlement can't tell where the account stands, the allocator resyncs, but only once the transactions in flight have settled (reservations wait for it meanwhile). It then resyncs from the chain, or from the outcomes seen (`floor`) when the chain's committed sequence lags behind them.
+  """
+  node_client: NodeClient
+  address: str | None = None
+  next: int | None = None
+  """Next sequence to reserve (`None` until synced, or to resync once `in_flight` settles)."""
+  in_flight: set[int] = field(default_factory=set, init=False, repr=False)
+  """Reserved sequences whose transaction's outcome isn't known yet."""
+  floor: int = field(default=0, init=False, repr=False)
+  """Sequence the chain expects next at least, from the outcomes seen: after the latest accepted one, or as expected by a mismatch."""
+  settled: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+  """Set while no transaction is in flight."""
+  lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+  def __post_init__(self):
+    self.settled.set()
+
+  async def sync(self, address: str):
+    """Fetch the account's current sequence. Must be called with the lock held, and nothing in flight."""
+    account = await fetch_account(self.node_client, address)
+    if address != self.address:
+      self.floor = 0
+    self.address = address
+    # the committed sequence doesn't count transactions accepted since the last block
+    self.next = max(account.sequence, self.floor)
+
+  async def reserve(self, address: str) -> int:
+    async with self.lock:
+      while self.next is None or self.address != address:
+        await self.settled.wait()
+        await self.sync(address)
+      seq = self.next
+      self.next = seq + 1
+      self.in_flight.add(seq)
+      self.settled.clear()
+      return seq
+
+  async def current(self, address: str) -> int:
+    """The next sequence, without reserving it (for short-term messages)."""
+    if self.next is not None and self.address == address:
+      return self.next
+    if self.in_flight:
+      # not synced while stateful transactions are in flight: don't wait for them, but don't store it either
+      return (await fetch_account(self.node_client, address)).sequence
+    async with self.lock:
+      if self.next is None or self.address != address:
+        await self.settled.wait()
+        await self.sync(address)
+      return self.next # type: ignore
+
+  def settle(self, seq: int):
+    self.in_flight.discard(seq)
+    if not self.in_flight:
+      self.settled.set()
+
+  def confirm(self, seq: int):
+    """Settle `seq`, whose transaction was accepted."""
+    self.settle(seq)
+    self.floor = max(self.floor, seq + 1)
+
+  def release(self, seq: int):
+    """Settle `seq`, whose transaction was rejected (so the sequence wasn't consumed): give it back if it's the latest reserved."""
+    self.settle(seq)
+    if self.next is not None and self.next == seq + 1:
+      self.next = seq
+    else:
+      # later sequences were reserved already: they may fail, so resync once they've settled
+      self.next = None
+
+  def mismatch(self, seq: int, raw_log: str):
+    """Settle `seq` after an "account sequence mismatch": from the expected sequence in the error if nothing else is in flight, else resync once the others have settled."""
+    self.settle(seq)
+    if (m := EXPECTED_SEQUENCE.search(raw_log)) is None:
+      self.next = None
+    elif not self.in_flight:
+      logger.info(f'Account sequence mismatch, resyncing to {m.group(1)}')
+      self.next = self.floor = int(m.group(1))
+    else:
+      self.floor = max(self.floor, int(m.group(1)))
+      self.next = None
+
+  def resync(self, seq: int):
+    """Settle `seq`, whose transaction's outcome is unknown (e.g. the broadcast failed): resync once the others have settled."""
+    self.settle(seq)
+    self.next = None
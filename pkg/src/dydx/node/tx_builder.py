@@ -0,0 +1,68 @@
+from typing_extensions import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from google.protobuf.message import Message
+from google.protobuf.any_pb2 import Any as AnyProto
+from v4_proto.cosmos.tx.signing.v1beta1.signing_pb2 import SignMode
+from v4_proto.cosmos.tx.v1beta1.tx_pb2 import AuthInfo, Fee, ModeInfo, SignDoc, SignerInfo, TxBody, TxRaw
+from dydx_v4_client.key_pair import KeyPair
+from dydx_v4_client.wallet import Wallet
+from dydx_v4_client.node.builder import Builder, DEFAULT_FEE, as_any
+
+class CachedWallet(Wallet):
+  """`Wallet` with its address and public key computed once (the address alone takes tens of microseconds)."""
+  @cached_property
+  def address(self) -> str: # type: ignore
+    return Wallet.address.fget(self) # type: ignore
+
+  @cached_property
+  def public_key(self): # type: ignore
+    return Wallet.public_key.fget(self) # type: ignore
+
+@dataclass
+class TxBuilder:
+  """Signs transactions with the signer's state (public key, account number, chain id, fee) computed once.
+
+  Produces the same bytes as `dydx_v4_client`'s `Builder`, but skips rebuilding the signer info and re-serializing the body. It works offline, e.g. to benchmark signing:
+
+  ```python
+  builder = TxBuilder.from_mnemonic(mnemonic, chain_id='dydx-testnet-4', account_number=0)
+  timeit.timeit(lambda: builder.sign([builder.pack(msg)], sequence=0), number=1000)
+  ```
+  """
+  key: KeyPair = field(repr=False)
+  chain_id: str
+  account_number: int
+  memo: str = ''
+  fee: Fee = field(default_factory=lambda: DEFAULT_FEE, repr=False)
+  address: str = field(init=False)
+  public_key: AnyProto = field(init=False, repr=False)
+  mode_info: ModeInfo = field(init=False, repr=False)
+
+  def __post_init__(self):
+    wallet = CachedWallet(self.key, self.account_number, 0)
+    self.address = wallet.address
+    self.public_key = as_any(wallet.public_key)
+    self.mode_info = ModeInfo(single=ModeInfo.Single(mode=SignMode.SIGN_MODE_DIRECT))
+
+  @classmethod
+  def of(cls, wallet: Wallet, builder: Builder) -> 'TxBuilder':
+    return cls(key=wallet.key, chain_id=builder.chain_id, account_number=wallet.account_number, memo=builder.memo)
+
+  @classmethod
+  def from_mnemonic(cls, mnemonic: str, *, chain_id: str, account_number: int, memo: str = '') -> 'TxBuilder':
+    return cls(key=KeyPair.from_mnemonic(mnemonic), chain_id=chain_id, account_number=account_number, memo=memo)
+
+  @staticmethod
+  def pack(message: Message) -> AnyProto:
+    return as_any(message)
+
+  def sign(self, messages: Sequence[AnyProto], *, sequence: int) -> bytes:
+    """Sign (packed) `messages` with `sequence`, returning the serialized transaction, ready to broadcast."""
+    body = TxBody(messages=messages, memo=self.memo).SerializeToString()
+    signer = SignerInfo(public_key=self.public_key, mode_info=self.mode_info, sequence=sequence)
+    auth_info = AuthInfo(signer_infos=[signer], fee=self.fee).SerializeToString()
+    doc = SignDoc(body_bytes=body, auth_info_bytes=auth_info, account_number=self.account_number, chain_id=self.chain_id)
+    signature = self.key.sign(doc.SerializeToString())
+    return TxRaw(body_bytes=body, auth_info_bytes=auth_info, signatures=[signature]).SerializeToString()